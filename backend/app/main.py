@@ -1,12 +1,23 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.api.routes import api_router
+from app.modules.reporting import shutdown_plot_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Report plot workers outlive requests; stop them with the app
+    shutdown_plot_pool()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 # Set all CORS enabled origins
@@ -83,7 +83,7 @@ class MemoryEfficientScanner:
         df = pd.read_csv(file_path, low_memory=False, memory_map=True)
         
         # Check memory usage
-        memory_usage = df.memory_usage(deep=True).sum()
+        memory_usage = self._estimate_memory_usage(df)
         if memory_usage > self.max_memory:
             # Fallback to sampling if memory exceeds limit
             return self._scan_large_dataset(file_path, original_filename)
@@ -107,6 +107,23 @@ class MemoryEfficientScanner:
             }
         }
     
+    def _estimate_memory_usage(self, df: pd.DataFrame, sample_rows: int = 1000) -> int:
+        """
+        Approximate deep memory usage in bytes.
+        
+        Fixed-width columns are measured shallowly (dtype size x rows); only
+        object columns are probed per cell, on a head sample extrapolated to
+        the full length, instead of walking every string in the frame.
+        """
+        obj_cols = df.select_dtypes(include="object").columns
+        total = int(df.drop(columns=obj_cols).memory_usage(deep=False, index=True).sum())
+        if len(obj_cols) == 0 or len(df) == 0:
+            return total
+        
+        sample = df[obj_cols].head(sample_rows)
+        per_row = sample.memory_usage(deep=True, index=False).sum() / len(sample)
+        return total + int(per_row * len(df))
+    
     def _get_basic_profile(self, df: pd.DataFrame, total_rows: int) -> Dict[str, Any]:
         """Get basic dataset profile information."""
         return {
@@ -1,13 +1,20 @@
 import os
 import pandas as pd
+import math
 import numpy as np
 import base64
 import io
+import threading
+from contextlib import contextmanager
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import seaborn as sns
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader
 from app.schemas.analysis import AnalysisResult
@@ -19,145 +26,368 @@ from app.modules.plot_config import apply_publication_config
 from fpdf import FPDF
 
 TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+# Built once per process; with auto_reload off, get_template() is a cache hit after
+# the first render instead of a stat + reparse of report.html.
+_JINJA_ENV = Environment(loader=FileSystemLoader(TEMPLATE_DIR), auto_reload=False)
 
-def _render_plot_png_bytes(res: Dict[str, Any]) -> bytes:
+# One Agg figure per thread, reset and reused for every report plot instead of
+# going through pyplot's figure manager for each one.
+_PLOT_FIGURES = threading.local()
+_SUBPLOT_PARAMS = ("left", "right", "bottom", "top", "wspace", "hspace")
+
+
+@contextmanager
+def _reusable_figure(figsize) -> Iterator[Figure]:
+    """
+    Check out this thread's Agg figure, set up as a fresh Figure(figsize) would be.
+
+    Each thread that renders a plot keeps one empty Figure for the life of the
+    process. On release the figure is cleared and given a new canvas, so neither
+    the plot's artists nor the rasterized buffer outlive the call.
+    """
+    fig = getattr(_PLOT_FIGURES, "figure", None)
+    if fig is None:
+        fig = Figure()
+        _PLOT_FIGURES.figure = fig
+    fig.clear()
+    # Re-read everything a fresh figure takes from rcParams: the previous plot
+    # may have run under other rcParams, and tight_layout moves the subplot params.
+    rc = matplotlib.rcParams
+    fig.set_size_inches(figsize)
+    fig.set_dpi(rc["figure.dpi"])
+    fig.set_facecolor(rc["figure.facecolor"])
+    fig.set_edgecolor(rc["figure.edgecolor"])
+    fig.set_frameon(rc["figure.frameon"])
+    fig.set_layout_engine(None)
+    fig.subplots_adjust(**{k: rc[f"figure.subplot.{k}"] for k in _SUBPLOT_PARAMS})
+    FigureCanvasAgg(fig)
+    try:
+        yield fig
+    finally:
+        fig.clear()
+        FigureCanvasAgg(fig)  # drops the previous canvas and its render buffer
+
+
+def _present(value: Any) -> bool:
+    """Not None/NaN, i.e. what pandas' dropna() would keep."""
+    return value is not None and value == value
+
+
+def _as_float(values: List[Any]) -> np.ndarray:
+    """Float vector; missing or non-numeric entries become NaN, as pd.to_numeric(errors="coerce")."""
+    return np.asarray(pd.to_numeric(pd.Series(values, dtype=object), errors="coerce"), dtype=float)
+
+
+def _plot_columns(plot_data: List[Dict[str, Any]], *names: str, numeric: bool = False) -> Dict[str, Any]:
+    """Column vectors for the given keys; rows lacking a key contribute None (NaN when numeric)."""
+    columns = {}
+    for name in names:
+        column = [row.get(name) for row in plot_data]
+        columns[name] = _as_float(column) if numeric else column
+    return columns
+
+
+def _render_plot_png_bytes(res: Dict[str, Any], dpi: Optional[float] = None) -> bytes:
     try:
         apply_publication_config()
-        plt.figure(figsize=(8, 5))
+        with _reusable_figure((8, 5)) as fig:
+            ax = fig.add_subplot()
 
-        plot_data = []
-        plot_config = {}
+            plot_data = []
+            plot_config = {}
 
-        if isinstance(res, dict):
-            roc = res.get("roc")
-            if isinstance(roc, dict) and isinstance(roc.get("plot_data"), list) and roc.get("plot_data"):
-                plot_data = roc.get("plot_data")
-                plot_config = roc.get("plot_config") if isinstance(roc.get("plot_config"), dict) else {}
-            else:
-                plot_data = res.get("plot_data", [])
-                plot_config = res.get("plot_config") if isinstance(res.get("plot_config"), dict) else {}
-
-        if plot_data:
-            df_plot = pd.DataFrame(plot_data)
-
-            if "group" in df_plot.columns and "value" in df_plot.columns:
-                sns.boxplot(x="group", y="value", data=df_plot, showfliers=False, color="lightblue", width=0.5)
-                sns.stripplot(
-                    x="group",
-                    y="value",
-                    data=df_plot,
-                    size=4,
-                    alpha=0.6,
-                    color="#0f172a",
-                )
-                plt.title("Group Comparison")
-
-                comparisons_raw = None
-                if isinstance(res, dict):
-                    comparisons_raw = res.get("comparisons") or res.get("plot_comparisons") or res.get("post_hoc")
-
-                comparisons = normalize_comparisons(comparisons_raw)
-                if comparisons:
-                    group_order = [str(g) for g in (df_plot["group"].dropna().unique().tolist() or [])]
-                    group_index = {g: i for i, g in enumerate(group_order)}
-
-                    values = df_plot["value"].dropna().astype(float)
-                    if len(values) > 0:
-                        min_val = float(values.min())
-                        max_val = float(values.max())
-                        y_range = (max_val - min_val) or 1.0
-                        base_pad = y_range * 0.08
-                        step_pad = y_range * 0.08
-                        y_base = max_val + base_pad
-
-                        ranges = []
-                        placed = []
-                        for c in comparisons:
-                            ia = group_index.get(c.a)
-                            ib = group_index.get(c.b)
-                            if ia is None or ib is None:
-                                continue
-                            start = min(ia, ib)
-                            end = max(ia, ib)
-
-                            level = 0
-                            while True:
-                                taken = ranges[level] if level < len(ranges) else []
-                                overlaps = any(not (end < r[0] or start > r[1]) for r in taken)
-                                if not overlaps:
-                                    break
-                                level += 1
-                            while level >= len(ranges):
-                                ranges.append([])
-                            ranges[level].append((start, end))
-                            placed.append((start, end, level, c.p_value))
-
-                        ax = plt.gca()
-                        max_level = max((lvl for _, _, lvl, _ in placed), default=-1)
-                        try:
-                            y0, y1_lim = ax.get_ylim()
-                            extra = (max_level + 2) * step_pad
-                            ax.set_ylim(y0, max(y1_lim, max_val + base_pad + extra))
-                        except Exception:
-                            pass
-                        for start, end, level, p_value in placed:
-                            add_significance_bracket(
-                                ax,
-                                float(start),
-                                float(end),
-                                y_base + level * step_pad,
-                                p_value,
-                                h=0.02,
-                                lw=1.2,
-                                color="#0f172a",
-                            )
-
-            elif "x" in df_plot.columns and "y" in df_plot.columns:
-                if plot_config.get("type") == "line":
-                    df_sorted = df_plot.sort_values("x")
-                    plt.plot(df_sorted["x"], df_sorted["y"], color="#8b5cf6", linewidth=2)
-                    plt.plot([0, 1], [0, 1], linestyle="--", color="#666", linewidth=1)
-                    plt.xlim(0, 1)
-                    plt.ylim(0, 1)
-                    plt.title("ROC Curve")
+            if isinstance(res, dict):
+                roc = res.get("roc")
+                if isinstance(roc, dict) and isinstance(roc.get("plot_data"), list) and roc.get("plot_data"):
+                    plot_data = roc.get("plot_data")
+                    plot_config = roc.get("plot_config") if isinstance(roc.get("plot_config"), dict) else {}
                 else:
-                    sns.scatterplot(x="x", y="y", data=df_plot)
-                    sns.regplot(x="x", y="y", data=df_plot, scatter=False, color="red")
-                    plt.title("Correlation Analysis")
-
-            elif "probability" in df_plot.columns and "time" in df_plot.columns and "group" in df_plot.columns:
-                groups = df_plot["group"].unique()
-                for g in groups:
-                    sub = df_plot[df_plot["group"] == g]
-                    plt.step(sub["time"], sub["probability"], where="post", label=f"Group {g}")
-                plt.ylim(0, 1.05)
-                plt.legend()
-                plt.title("Kaplan-Meier Survival Curve")
+                    plot_data = res.get("plot_data", [])
+                    plot_config = res.get("plot_config") if isinstance(res.get("plot_config"), dict) else {}
+
+            if plot_data:
+                # Plot data is a short list of row dicts: read columns straight off the rows
+                # instead of materializing a DataFrame for every plot.
+                keys = set().union(*plot_data)
+
+                if "group" in keys and "value" in keys:
+                    columns = {**_plot_columns(plot_data, "group"), **_plot_columns(plot_data, "value", numeric=True)}
+                    sns.boxplot(x="group", y="value", data=columns, showfliers=False, color="lightblue", width=0.5, ax=ax)
+                    sns.stripplot(
+                        x="group",
+                        y="value",
+                        data=columns,
+                        size=4,
+                        alpha=0.6,
+                        color="#0f172a",
+                        ax=ax,
+                    )
+                    ax.set_title("Group Comparison")
+
+                    comparisons_raw = None
+                    if isinstance(res, dict):
+                        comparisons_raw = res.get("comparisons") or res.get("plot_comparisons") or res.get("post_hoc")
+
+                    comparisons = normalize_comparisons(comparisons_raw)
+                    if comparisons:
+                        group_order = [str(g) for g in dict.fromkeys(g for g in columns["group"] if _present(g))]
+                        group_index = {g: i for i, g in enumerate(group_order)}
+
+                        values = [float(v) for v in columns["value"] if _present(v)]
+                        if len(values) > 0:
+                            min_val = min(values)
+                            max_val = max(values)
+                            y_range = (max_val - min_val) or 1.0
+                            base_pad = y_range * 0.08
+                            step_pad = y_range * 0.08
+                            y_base = max_val + base_pad
+
+                            ranges = []
+                            placed = []
+                            for c in comparisons:
+                                ia = group_index.get(c.a)
+                                ib = group_index.get(c.b)
+                                if ia is None or ib is None:
+                                    continue
+                                start = min(ia, ib)
+                                end = max(ia, ib)
+
+                                level = 0
+                                while True:
+                                    taken = ranges[level] if level < len(ranges) else []
+                                    overlaps = any(not (end < r[0] or start > r[1]) for r in taken)
+                                    if not overlaps:
+                                        break
+                                    level += 1
+                                while level >= len(ranges):
+                                    ranges.append([])
+                                ranges[level].append((start, end))
+                                placed.append((start, end, level, c.p_value))
+
+                            max_level = max((lvl for _, _, lvl, _ in placed), default=-1)
+                            try:
+                                y0, y1_lim = ax.get_ylim()
+                                extra = (max_level + 2) * step_pad
+                                ax.set_ylim(y0, max(y1_lim, max_val + base_pad + extra))
+                            except Exception:
+                                pass
+                            for start, end, level, p_value in placed:
+                                add_significance_bracket(
+                                    ax,
+                                    float(start),
+                                    float(end),
+                                    y_base + level * step_pad,
+                                    p_value,
+                                    h=0.02,
+                                    lw=1.2,
+                                    color="#0f172a",
+                                )
+
+                elif "x" in keys and "y" in keys:
+                    columns = _plot_columns(plot_data, "x", "y", numeric=True)
+                    if plot_config.get("type") == "line":
+                        # Same ordering as DataFrame.sort_values: quicksort over the
+                        # non-NaN values only (ties land as pandas leaves them), NaN last
+                        x = columns["x"]
+                        missing = np.isnan(x)
+                        kept = np.flatnonzero(~missing)
+                        order = np.concatenate([kept[np.argsort(x[kept], kind="quicksort")], np.flatnonzero(missing)])
+                        ax.plot(columns["x"][order], columns["y"][order], color="#8b5cf6", linewidth=2)
+                        ax.plot([0, 1], [0, 1], linestyle="--", color="#666", linewidth=1)
+                        ax.set_xlim(0, 1)
+                        ax.set_ylim(0, 1)
+                        ax.set_title("ROC Curve")
+                    else:
+                        sns.scatterplot(x="x", y="y", data=columns, ax=ax)
+                        sns.regplot(x="x", y="y", data=columns, scatter=False, color="red", ax=ax)
+                        ax.set_title("Correlation Analysis")
+
+                elif "probability" in keys and "time" in keys and "group" in keys:
+                    curves: Dict[Any, tuple] = {}
+                    for row in plot_data:
+                        g = row.get("group")
+                        if not _present(g):
+                            # All missing groups share one (empty) curve, as with DataFrame.unique()
+                            curves.setdefault(None, ([], []))
+                            continue
+                        times, probs = curves.setdefault(g, ([], []))
+                        times.append(row.get("time"))
+                        probs.append(row.get("probability"))
+                    for g, (times, probs) in curves.items():
+                        ax.step(_as_float(times), _as_float(probs), where="post", label=f"Group {g}")
+                    ax.set_ylim(0, 1.05)
+                    ax.legend()
+                    ax.set_title("Kaplan-Meier Survival Curve")
 
-        else:
-            plot_stats = res.get("plot_stats", {}) if isinstance(res, dict) else {}
-            if plot_stats:
-                groups = list(plot_stats.keys())
-                means = [s["mean"] for s in plot_stats.values()]
-                sems = [s["sem"] for s in plot_stats.values()]
-                plt.bar(groups, means, yerr=sems, capsize=5, color="skyblue", alpha=0.8)
-                plt.title("Mean comparison (±SEM)")
             else:
-                plt.text(0.5, 0.5, "No Visualization Available", ha="center", va="center", transform=plt.gca().transAxes)
+                plot_stats = res.get("plot_stats", {}) if isinstance(res, dict) else {}
+                if plot_stats:
+                    groups = list(plot_stats.keys())
+                    means = [s["mean"] for s in plot_stats.values()]
+                    sems = [s["sem"] for s in plot_stats.values()]
+                    ax.bar(groups, means, yerr=sems, capsize=5, color="skyblue", alpha=0.8)
+                    ax.set_title("Mean comparison (±SEM)")
+                else:
+                    ax.text(0.5, 0.5, "No Visualization Available", ha="center", va="center", transform=ax.transAxes)
 
-        buf = io.BytesIO()
-        plt.tight_layout()
-        plt.savefig(buf, format="png")
-        plt.close()
-        return bytes(buf.getvalue())
+            buf = io.BytesIO()
+            fig.tight_layout()
+            fig.savefig(buf, format="png", dpi=dpi)  # None -> rcParams["savefig.dpi"]
+            return bytes(buf.getvalue())
     except Exception as e:
         logger.error(f"Plotting failed: {e}", exc_info=True)
-        try:
-            plt.close()
-        except Exception:
-            pass
         return b""
 
+# Cell/line formatters shared by the DOCX and PDF exports
+def _fmt_p(value: Any) -> str:
+    try:
+        if value is None:
+            return "-"
+        p = float(value)
+        if not math.isfinite(p):
+            return "-"
+        return "< 0.001" if p < 0.001 else f"{p:.4f}"
+    except Exception:
+        return "-"
+
+
+def _fmt_num(value: Any, digits: int = 3) -> str:
+    try:
+        if value is None:
+            return "-"
+        num = float(value)
+        if not math.isfinite(num):
+            return "-"
+        return f"{num:.{digits}f}"
+    except Exception:
+        return "-"
+
+
+def _txt(value: Any) -> str:
+    return "-" if value is None else str(value)
+
+
+def _safe_text(value: Any) -> str:
+    if value is None:
+        return ""
+    text = str(value)
+    return text.encode("latin-1", errors="replace").decode("latin-1")
+
+
+def _pdf_bytes(pdf: FPDF) -> bytes:
+    try:
+        out = pdf.output()
+    except TypeError:
+        out = pdf.output(dest="S")
+    if isinstance(out, (bytes, bytearray)):
+        return bytes(out)
+    return str(out).encode("latin-1", errors="replace")
+
+
+def _roc_plot_job(res: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    roc = res.get("roc")
+    if isinstance(roc, dict) and isinstance(roc.get("plot_data"), list) and roc.get("plot_data"):
+        return {"plot_data": roc.get("plot_data"), "plot_config": roc.get("plot_config")}
+    return None
+
+
+# Plots placed 5.8" wide in a DOCX gain nothing from the 300 dpi publication setting
+_DOCX_PLOT_DPI = 150
+
+
+def _render_docx_plot_png(res: Dict[str, Any]) -> bytes:
+    """Plot PNG for embedding in a DOCX: 150 dpi, re-encoded with a 256-colour palette."""
+    png_bytes = _render_plot_png_bytes(res, dpi=_DOCX_PLOT_DPI)
+    if not png_bytes:
+        return png_bytes
+    try:
+        from PIL import Image
+
+        with Image.open(io.BytesIO(png_bytes)) as img:
+            paletted = img.convert("RGB").quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+            dpi = img.info.get("dpi")
+        buf = io.BytesIO()
+        paletted.save(buf, format="PNG", optimize=True, dpi=dpi)
+        return buf.getvalue()
+    except Exception as e:
+        logger.warning(f"PNG palette conversion failed, embedding RGB plot: {e}")
+        return png_bytes
+
+
+# Rasterization holds the GIL, so reports with many plots fan out to one shared,
+# lazily started process pool. Its workers come from a forkserver (spawn where that
+# is unavailable): forking the threaded API server directly can deadlock.
+_PLOT_POOL_MAX_WORKERS = 4
+_PARALLEL_PLOT_MIN_JOBS = 4
+_PLOT_POOL: Optional[ProcessPoolExecutor] = None
+_PLOT_POOL_WARMUP: List[Future] = []
+_PLOT_POOL_LOCK = threading.Lock()
+
+# The result keys _render_plot_png_bytes reads; only these are shipped to the pool
+_PLOT_JOB_KEYS = ("plot_data", "plot_config", "plot_stats", "comparisons", "plot_comparisons", "post_hoc", "roc")
+
+
+def _plot_job(res: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: res[k] for k in _PLOT_JOB_KEYS if k in res}
+
+
+def _warm_plot_worker() -> None:
+    """No-op task: unpickling it imports this module, and the plotting stack, in the worker."""
+
+
+def _plot_pool() -> Optional[ProcessPoolExecutor]:
+    """The shared plot pool once its workers are up; None before that or on a single-CPU host."""
+    global _PLOT_POOL, _PLOT_POOL_WARMUP
+    with _PLOT_POOL_LOCK:
+        if _PLOT_POOL is None:
+            workers = min(_PLOT_POOL_MAX_WORKERS, os.cpu_count() or 1)
+            if workers < 2:
+                return None
+            methods = multiprocessing.get_all_start_methods()
+            ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            _PLOT_POOL = ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+            # Workers start and import the plotting stack in the background; reports
+            # render serially until they are all up instead of waiting on the start-up.
+            _PLOT_POOL_WARMUP = [_PLOT_POOL.submit(_warm_plot_worker) for _ in range(workers)]
+        if not all(f.done() for f in _PLOT_POOL_WARMUP):
+            return None
+        return _PLOT_POOL
+
+
+def _discard_plot_pool(pool: ProcessPoolExecutor) -> None:
+    global _PLOT_POOL
+    with _PLOT_POOL_LOCK:
+        if _PLOT_POOL is pool:
+            _PLOT_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_plot_pool() -> None:
+    """Stop the shared plot worker processes (application shutdown)."""
+    pool = _PLOT_POOL
+    if pool is not None:
+        _discard_plot_pool(pool)
+
+
+def _render_plots_png_bytes(jobs: List[Dict[str, Any]]) -> List[bytes]:
+    """
+    Render the DOCX plots, in input order. Short reports render in-process, where
+    pool round-trips would cost more than they save; anything that goes wrong in
+    the pool falls back to serial rendering.
+    """
+    if len(jobs) >= _PARALLEL_PLOT_MIN_JOBS:
+        pool = None
+        try:
+            pool = _plot_pool()
+            if pool is not None:
+                return list(pool.map(_render_docx_plot_png, jobs))
+        except Exception as e:
+            logger.warning(f"Parallel plot rendering failed, rendering serially: {e}")
+            if isinstance(e, BrokenProcessPool) and pool is not None:
+                _discard_plot_pool(pool)
+    return [_render_docx_plot_png(job) for job in jobs]
+
+
 class ProtocolReport:
     """
     Generates a comprehensive HTML report from a Protocol Analysis Run.
@@ -437,7 +667,7 @@ class ProtocolReport:
             png_bytes = _render_plot_png_bytes(res)
             if not png_bytes:
                 return ""
-            return base64.b64encode(png_bytes).decode("utf-8")
+            return base64.b64encode(png_bytes).decode("ascii")
         except Exception as e:
             logger.error(f"Plotting failed: {e}", exc_info=True)
             return ""
@@ -447,30 +677,19 @@ def generate_protocol_docx_report(run_data: Dict[str, Any], dataset_name: str =
     from docx import Document
     from docx.shared import Inches
 
-    def _fmt_p(value: Any) -> str:
-        try:
-            if value is None:
-                return "-"
-            p = float(value)
-            if not np.isfinite(p):
-                return "-"
-            return "< 0.001" if p < 0.001 else f"{p:.4f}"
-        except Exception:
-            return "-"
-
-    def _fmt_num(value: Any, digits: int = 3) -> str:
-        try:
-            if value is None:
-                return "-"
-            num = float(value)
-            if not np.isfinite(num):
-                return "-"
-            return f"{num:.{digits}f}"
-        except Exception:
-            return "-"
+    def _fill_row(tr, texts) -> None:
+        # Cells of a new row hold one empty paragraph: append the run to it directly
+        # rather than through _Cell.text, which clears and rebuilds every cell.
+        for tc, text in zip(tr.tc_lst, texts):
+            tc.p_lst[0].add_r().text = text
 
-    def _txt(value: Any) -> str:
-        return "-" if value is None else str(value)
+    def _add_filled_table(rows: List[List[str]], cols: int):
+        # add_table(rows=n) builds the whole w:tbl in one go; add_row() per row
+        # would append and re-derive cell widths one row at a time.
+        table = doc.add_table(rows=len(rows), cols=cols)
+        for tr, texts in zip(table._tbl.tr_lst, rows):
+            _fill_row(tr, texts)
+        return table
 
     style_key = str(style or "gost").strip().lower()
     is_ru = style_key in {"gost"}
@@ -484,6 +703,17 @@ def generate_protocol_docx_report(run_data: Dict[str, Any], dataset_name: str =
     doc.add_paragraph(("Дата" if is_ru else "Date") + f": {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M')}")
 
     results = run_data.get("results", {}) if isinstance(run_data, dict) else {}
+
+    # Rasterize every plot up front (in parallel), then lay the document out in order
+    plot_jobs: List[Dict[str, Any]] = []
+    for res in (results or {}).values():
+        if isinstance(res, dict) and res.get("type") != "table_1":
+            roc_job = _roc_plot_job(res)
+            if roc_job is not None:
+                plot_jobs.append(roc_job)
+            plot_jobs.append(_plot_job(res))
+    rendered = iter(_render_plots_png_bytes(plot_jobs))
+
     for step_id, res in (results or {}).items():
         doc.add_heading(("Шаг" if is_ru else "Step") + f": {step_id}", level=1)
 
@@ -496,45 +726,26 @@ def generate_protocol_docx_report(run_data: Dict[str, Any], dataset_name: str =
             if isinstance(stats_map, dict) and stats_map:
                 groups = [k for k in stats_map.keys() if k != "overall"]
                 cols = 2 + len(groups)
-                table = doc.add_table(rows=1, cols=cols)
-                hdr = table.rows[0].cells
-                hdr[0].text = "Показатель"
-                for i, g in enumerate(groups):
-                    n = _txt(stats_map.get(g, {}).get("count"))
-                    hdr[i + 1].text = f"{g} (n={n})"
-                overall_n = _txt(stats_map.get("overall", {}).get("count"))
-                hdr[-1].text = f"Итого (n={overall_n})"
-
-                def _cell_for(metric_key: str, s: Dict[str, Any]) -> str:
-                    if metric_key == "mean_sd":
-                        return f"{_fmt_num(s.get('mean'), 2)} ({_fmt_num(s.get('std'), 2)})"
-                    if metric_key == "ci_95":
-                        return f"[{_fmt_num(s.get('ci_95_low'), 2)}, {_fmt_num(s.get('ci_95_high'), 2)}]"
-                    if metric_key == "median_q1_q3":
-                        return f"{_fmt_num(s.get('median'), 2)} [{_fmt_num(s.get('q1'), 2)}, {_fmt_num(s.get('q3'), 2)}]"
-                    if metric_key == "iqr":
-                        return _fmt_num(s.get("iqr"), 2)
-                    if metric_key == "min_max":
-                        return f"{_fmt_num(s.get('min'), 2)} – {_fmt_num(s.get('max'), 2)}"
-                    if metric_key == "shapiro":
-                        return _fmt_p(s.get("shapiro_p"))
-                    return "-"
+                # Each column's stats dict, dug out once rather than per metric row
+                columns = [stats_map.get(g, {}) or {} for g in groups]
+                columns.append(stats_map.get("overall", {}) or {})
+                rows = [[
+                    "Показатель",
+                    *(f"{g} (n={_txt(s.get('count'))})" for g, s in zip(groups, columns)),
+                    f"Итого (n={_txt(columns[-1].get('count'))})",
+                ]]
 
                 metrics = [
-                    ("Mean (SD)", "mean_sd"),
-                    ("95% CI (Mean)", "ci_95"),
-                    ("Median [Q1, Q3]", "median_q1_q3"),
-                    ("IQR", "iqr"),
-                    ("Range (Min-Max)", "min_max"),
-                    ("Normality (Shapiro p)", "shapiro"),
+                    ("Mean (SD)", lambda s: f"{_fmt_num(s.get('mean'), 2)} ({_fmt_num(s.get('std'), 2)})"),
+                    ("95% CI (Mean)", lambda s: f"[{_fmt_num(s.get('ci_95_low'), 2)}, {_fmt_num(s.get('ci_95_high'), 2)}]"),
+                    ("Median [Q1, Q3]", lambda s: f"{_fmt_num(s.get('median'), 2)} [{_fmt_num(s.get('q1'), 2)}, {_fmt_num(s.get('q3'), 2)}]"),
+                    ("IQR", lambda s: _fmt_num(s.get("iqr"), 2)),
+                    ("Range (Min-Max)", lambda s: f"{_fmt_num(s.get('min'), 2)} – {_fmt_num(s.get('max'), 2)}"),
+                    ("Normality (Shapiro p)", lambda s: _fmt_p(s.get("shapiro_p"))),
                 ]
-
-                for label, key in metrics:
-                    row = table.add_row().cells
-                    row[0].text = label
-                    for i, g in enumerate(groups):
-                        row[i + 1].text = _cell_for(key, stats_map.get(g, {}) or {})
-                    row[-1].text = _cell_for(key, stats_map.get("overall", {}) or {})
+                for label, formatter in metrics:
+                    rows.append([label, *map(formatter, columns)])
+                _add_filled_table(rows, cols)
             continue
 
         method = res.get("method")
@@ -545,17 +756,13 @@ def generate_protocol_docx_report(run_data: Dict[str, Any], dataset_name: str =
             method_name = method
         doc.add_paragraph(f"Метод: {method_name}")
 
-        summary = doc.add_table(rows=0, cols=2)
-        for k, v in [
+        _add_filled_table([[str(k), str(v)] for k, v in [
             ("p-value", _fmt_p(res.get("p_value"))),
             ("stat", _fmt_num(res.get("stat_value", res.get("stats")), 3)),
             ("effect", f"{_txt(res.get('effect_size_name') or 'effect')} {_fmt_num(res.get('effect_size'), 2)}" if res.get("effect_size") is not None else "-"),
             ("power", _fmt_num(res.get("power"), 2)),
             ("BF10", _txt(res.get("bf10"))),
-        ]:
-            r = summary.add_row().cells
-            r[0].text = str(k)
-            r[1].text = str(v)
+        ]], 2)
 
         warnings = res.get("warnings")
         if isinstance(warnings, list) and warnings:
@@ -563,17 +770,16 @@ def generate_protocol_docx_report(run_data: Dict[str, Any], dataset_name: str =
             for w in warnings:
                 doc.add_paragraph(str(w), style="List Bullet")
 
-        roc = res.get("roc")
-        if isinstance(roc, dict) and isinstance(roc.get("plot_data"), list) and roc.get("plot_data"):
-            auc_val = roc.get("auc")
+        if _roc_plot_job(res) is not None:
+            auc_val = res["roc"].get("auc")
             if auc_val is not None:
                 doc.add_paragraph(f"AUC: {_fmt_num(auc_val, 3)}")
-            roc_png = _render_plot_png_bytes({"plot_data": roc.get("plot_data"), "plot_config": roc.get("plot_config")})
+            roc_png = next(rendered)
             if roc_png:
                 bio = BytesIO(roc_png)
                 doc.add_picture(bio, width=Inches(5.8))
 
-        png_bytes = _render_plot_png_bytes(res)
+        png_bytes = next(rendered)
         if png_bytes:
             bio = BytesIO(png_bytes)
             doc.add_picture(bio, width=Inches(5.8))
@@ -596,41 +802,41 @@ def generate_legacy_plot_image(plot_data: List[Dict[str, Any]], method_id: str)
     
     df = pd.DataFrame(plot_data)
     
-    plt.figure(figsize=(8, 6))
-    sns.set_theme(style="whitegrid")
+    with _reusable_figure((8, 6)) as fig:
+        sns.set_theme(style="whitegrid")
+        ax = fig.add_subplot()
     
-    is_parametric = method_id in ["t_test_ind", "t_test_rel"]
+        is_parametric = method_id in ["t_test_ind", "t_test_rel"]
     
-    ax = sns.stripplot(
-        data=df, 
-        x="group", 
-        y="value", 
-        jitter=True, 
-        alpha=0.6, 
-        size=8,
-        color="#0f172a"
-    )
+        sns.stripplot(
+            data=df, 
+            x="group", 
+            y="value", 
+            jitter=True, 
+            alpha=0.6, 
+            size=8,
+            color="#0f172a",
+            ax=ax
+        )
     
-    sns.boxplot(
-        data=df,
-        x="group",
-        y="value",
-        showfliers=False,
-        boxprops={'facecolor':'none', 'edgecolor':'grey'},
-        width=0.4,
-        ax=ax
-    )
-
-    plt.title(f"Distribution by Group ({method_id})")
-    plt.xlabel("Group")
-    plt.ylabel("Value")
+        sns.boxplot(
+            data=df,
+            x="group",
+            y="value",
+            showfliers=False,
+            boxprops={'facecolor':'none', 'edgecolor':'grey'},
+            width=0.4,
+            ax=ax
+        )
+
+        ax.set_title(f"Distribution by Group ({method_id})")
+        ax.set_xlabel("Group")
+        ax.set_ylabel("Value")
     
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', bbox_inches='tight', dpi=100)
-    plt.close()
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', bbox_inches='tight', dpi=100)
     
-    buf.seek(0)
-    return base64.b64encode(buf.read()).decode('utf-8')
+        return base64.b64encode(buf.getbuffer()).decode('ascii')
 
 def render_report(
     analysis_result: AnalysisResult,
@@ -661,52 +867,13 @@ def render_report(
         "p_value_fmt": f"{analysis_result.p_value:.4f}" if analysis_result.p_value >= 0.001 else "< 0.001"
     }
     
-    env = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
-    template = env.get_template("report.html")
-    return template.render(**context)
+    return _JINJA_ENV.get_template("report.html").render(**context)
 
 def render_protocol_report(run_data: Dict, dataset_name: str, style: Optional[str] = None) -> str:
     report = ProtocolReport(run_data, dataset_name, style=style or "apa7")
     return report.generate_html()
 
 def generate_pdf_report(results, variables, dataset_id):
-    def _safe_text(value: Any) -> str:
-        if value is None:
-            return ""
-        text = str(value)
-        return text.encode("latin-1", errors="replace").decode("latin-1")
-
-    def _fmt_num(value: Any, digits: int = 3) -> str:
-        try:
-            if value is None:
-                return "-"
-            num = float(value)
-            if not np.isfinite(num):
-                return "-"
-            return f"{num:.{digits}f}"
-        except Exception:
-            return "-"
-
-    def _fmt_p(value: Any) -> str:
-        try:
-            if value is None:
-                return "-"
-            p = float(value)
-            if not np.isfinite(p):
-                return "-"
-            return "< 0.001" if p < 0.001 else f"{p:.4f}"
-        except Exception:
-            return "-"
-
-    def _pdf_bytes(pdf: FPDF) -> bytes:
-        try:
-            out = pdf.output()
-        except TypeError:
-            out = pdf.output(dest="S")
-        if isinstance(out, (bytes, bytearray)):
-            return bytes(out)
-        return str(out).encode("latin-1", errors="replace")
-
     method = None
     if isinstance(results, dict):
         method = results.get("method")
@@ -777,43 +944,6 @@ def generate_pdf_report(results, variables, dataset_id):
 
 
 def generate_protocol_pdf_report(run_data: Dict[str, Any], dataset_name: str = "Dataset", style: Optional[str] = None) -> bytes:
-    def _safe_text(value: Any) -> str:
-        if value is None:
-            return ""
-        text = str(value)
-        return text.encode("latin-1", errors="replace").decode("latin-1")
-
-    def _fmt_num(value: Any, digits: int = 3) -> str:
-        try:
-            if value is None:
-                return "-"
-            num = float(value)
-            if not np.isfinite(num):
-                return "-"
-            return f"{num:.{digits}f}"
-        except Exception:
-            return "-"
-
-    def _fmt_p(value: Any) -> str:
-        try:
-            if value is None:
-                return "-"
-            p = float(value)
-            if not np.isfinite(p):
-                return "-"
-            return "< 0.001" if p < 0.001 else f"{p:.4f}"
-        except Exception:
-            return "-"
-
-    def _pdf_bytes(pdf: FPDF) -> bytes:
-        try:
-            out = pdf.output()
-        except TypeError:
-            out = pdf.output(dest="S")
-        if isinstance(out, (bytes, bytearray)):
-            return bytes(out)
-        return str(out).encode("latin-1", errors="replace")
-
     style_key = str(style or "apa7").strip().lower()
     is_ru = style_key in {"gost"}
 
@@ -1,8 +1,29 @@
 import pandas as pd
 import numpy as np
 import math
-from typing import Dict, Any, List
-from app.stats.engine import check_normality
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+from scipy import stats as scipy_stats
+from app.stats.assumptions import shapiro_sorted
+
+try:
+    # Optional: C-level text->float parsing, much faster than pd.to_numeric on object columns
+    from fastnumbers import try_array as _fn_try_array
+except ImportError:
+    _fn_try_array = None
+
+try:
+    # Optional: JIT-compiled numeric summary kernel
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Below this many columns the thread pool costs more than it saves
+PARALLEL_SCAN_MIN_COLUMNS = 16
+
+# Largest sample Shapiro-Wilk is run on; bigger columns use D'Agostino-Pearson
+SHAPIRO_MAX_N = 5000
 
 
 def _safe_float(value):
@@ -17,6 +38,168 @@ def _safe_float(value):
     except (ValueError, TypeError):
         return None
 
+def _numeric_summary_numpy(a: np.ndarray, nbins: int):
+    counts, edges = np.histogram(a, bins=nbins)
+    return a.mean(), a.min(), a.max(), counts, edges
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _numeric_summary_jit(a, nbins):
+        n = a.shape[0]
+        mean = 0.0
+        mn = a[0]
+        mx = a[0]
+        for i in range(n):
+            x = a[i]
+            mean += (x - mean) / (i + 1)
+            if x < mn:
+                mn = x
+            if x > mx:
+                mx = x
+
+        lo, hi = mn, mx
+        if lo == hi:
+            lo -= 0.5
+            hi += 0.5
+        edges = np.linspace(lo, hi, nbins + 1)
+        counts = np.zeros(nbins, dtype=np.int64)
+        scale = nbins / (hi - lo)
+        for i in range(n):
+            x = a[i]
+            k = int((x - lo) * scale)
+            if k >= nbins:
+                k = nbins - 1
+            # Same edge corrections as np.histogram
+            if k > 0 and x < edges[k]:
+                k -= 1
+            elif k < nbins - 1 and x >= edges[k + 1]:
+                k += 1
+            counts[k] += 1
+        return mean, mn, mx, counts, edges
+
+
+def _numeric_summary(a: np.ndarray, nbins: int = 12):
+    """
+    (mean, min, max, counts, edges) of a non-empty finite float64 array.
+    Histogram matches np.histogram(a, bins=nbins).
+    """
+    if njit is not None:
+        return _numeric_summary_jit(a, nbins)
+    return _numeric_summary_numpy(a, nbins)
+
+
+def _bounded_nunique(arr: np.ndarray, cap: int = 201, chunk_size: int = 10_000) -> int:
+    """
+    Number of distinct non-null values in arr, stopping early once it exceeds cap.
+    Returns cap + 1 when the limit is crossed; exact otherwise.
+    """
+    seen = set()
+    for start in range(0, len(arr), chunk_size):
+        u = pd.unique(arr[start:start + chunk_size])
+        seen.update(u[~pd.isna(u)].tolist())
+        if len(seen) > cap:
+            return cap + 1
+    return len(seen)
+
+
+_SIGNED_INT_DTYPES = tuple(np.iinfo(t) for t in (np.int8, np.int16, np.int32, np.int64))
+
+
+def _downcast_int(arr: np.ndarray) -> np.ndarray:
+    """
+    Smallest signed integer dtype holding arr, from one min/max pass and one cast.
+    Signed like pd.to_numeric(downcast="integer"), so later arithmetic cannot wrap.
+    """
+    if arr.size == 0:
+        return arr.astype(np.int8)
+    mn, mx = int(arr.min()), int(arr.max())
+    for dtype in _SIGNED_INT_DTYPES:
+        if dtype.min <= mn and mx <= dtype.max:
+            return arr.astype(dtype.dtype, copy=False)
+    # uint64 values beyond the int64 range
+    return arr
+
+
+def _downcast_float(arr: np.ndarray) -> np.ndarray:
+    """float32 when it keeps values within pandas' downcast tolerance (atol 5e-4)."""
+    if arr.dtype.itemsize <= 4:
+        return arr
+    with np.errstate(over="ignore"):
+        narrowed = arr.astype(np.float32)
+    if np.allclose(narrowed, arr, equal_nan=True, rtol=0.0, atol=5e-4):
+        return narrowed
+    return arr
+
+
+def _downcast(s: pd.Series, kind: str):
+    """Downcast a numeric column; extension dtypes (Int64 etc.) go through pandas."""
+    if not isinstance(s.dtype, np.dtype):
+        return pd.to_numeric(s, downcast=kind).array
+    values = s.to_numpy()
+    return _downcast_int(values) if kind == "integer" else _downcast_float(values)
+
+
+def _first_k_polluters(orig: np.ndarray, converted_nan: np.ndarray, k: int = 5) -> List[str]:
+    """
+    First k distinct non-null values (as strings) that failed numeric conversion.
+    Scans only the failed positions and stops at the k-th hit.
+    """
+    seen = set()
+    polluters = []
+    for i in np.flatnonzero(converted_nan):
+        v = orig[i]
+        if v is None or v is pd.NA or v is pd.NaT or (isinstance(v, float) and math.isnan(v)):
+            continue
+        sv = str(v)
+        if sv in seen:
+            continue
+        seen.add(sv)
+        polluters.append(sv)
+        if len(polluters) == k:
+            break
+    return polluters
+
+
+def _prepare_numeric(finite: np.ndarray, nbins: int = 12):
+    """
+    Sort a non-empty finite float array once and derive (mean, min, max, counts, edges)
+    from it. Histogram matches np.histogram(finite, bins=nbins): each edge is located
+    with a binary search instead of binning every value.
+    Returns (sorted_array, summary).
+    """
+    arr = np.sort(finite)
+    mn, mx = arr[0], arr[-1]
+    lo, hi = (mn - 0.5, mx + 0.5) if mn == mx else (mn, mx)
+    edges = np.linspace(lo, hi, nbins + 1)
+    idx = np.searchsorted(arr, edges, side="left")
+    idx[-1] = len(arr)  # last bin is closed on the right
+    return arr, (arr.mean(), mn, mx, np.diff(idx), edges)
+
+
+def _coerce_numeric(series: pd.Series) -> np.ndarray:
+    """
+    Parse a text/object column as float64; unparseable entries become NaN.
+    Same semantics as pd.to_numeric(errors="coerce"), using fastnumbers when installed.
+    """
+    if _fn_try_array is not None:
+        try:
+            return _fn_try_array(
+                series.to_numpy(dtype=object), dtype=float,
+                on_fail=np.nan, on_type_error=np.nan,
+            )
+        except Exception:
+            pass
+    return _to_numeric(series).to_numpy(dtype=float, na_value=np.nan)
+
+
+def _to_numeric(series: pd.Series) -> pd.Series:
+    """pd.to_numeric(errors="coerce"), stringifying only if pandas rejects the raw objects."""
+    try:
+        return pd.to_numeric(series, errors="coerce")
+    except (TypeError, ValueError):
+        return pd.to_numeric(series.astype(str), errors="coerce")
+
 class SmartScanner:
     """
     Analyzes a DataFrame for common "Dirty Data" problems and scientific metadata.
@@ -35,17 +218,21 @@ class SmartScanner:
         }
         """
         # --- 1. Basic Metadata ---
-        # Replace inf/-inf and nan with None for JSON serialization
-        safe_head = df.head(10).copy()
-        for col in safe_head.columns:
-            if pd.api.types.is_numeric_dtype(safe_head[col]):
-                safe_head[col] = safe_head[col].replace([np.inf, -np.inf], np.nan)
-        safe_head = safe_head.replace({np.nan: None})
+        # Replace inf/-inf, nan and NA/NaT with None for JSON serialization
+        head = df.head(10).to_dict(orient="records")
+        _isfinite = math.isfinite
+        for record in head:
+            for k, v in record.items():
+                if isinstance(v, float):
+                    if not _isfinite(v):
+                        record[k] = None
+                elif v is pd.NA or v is pd.NaT:
+                    record[k] = None
         
         profile = {
             "row_count": len(df),
             "col_count": len(df.columns),
-            "head": safe_head.to_dict(orient="records") 
+            "head": head
         }
 
         # --- 2. Deep Scan ---
@@ -60,11 +247,30 @@ class SmartScanner:
             }
         }
 
-        missing_by_column = []
+        # Frame-wide reductions in one vectorized pass instead of per column
+        missing = df.isna().sum()
+        missing_pct = (missing / max(1, len(df)) * 100).round(2)
+        nunique = df.nunique(dropna=True)
+
+        # Analyze columns (Combines profiling + smart checks). Columns are independent
+        # and the NumPy/pandas reductions release the GIL, so wide frames use threads.
+        def analyze(i: int) -> Dict[str, Any]:
+            return self._analyze_column(
+                df.iloc[:, i], str(df.columns[i]),
+                missing_count=int(missing.iat[i]),
+                unique_count=int(nunique.iat[i]),
+            )
+
+        n_cols = len(df.columns)
+        if n_cols >= PARALLEL_SCAN_MIN_COLUMNS:
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                col_reports = list(executor.map(analyze, range(n_cols)))
+        else:
+            col_reports = [analyze(i) for i in range(n_cols)]
         
-        for col in df.columns:
-            # Analyze column (Combines profiling + smart checks)
-            col_report = self._analyze_column(df[col], str(col))
+        for col, col_report, missing_count, missing_percent in zip(
+            df.columns, col_reports, missing.to_numpy(), missing_pct.to_numpy()
+        ):
             report["columns"][str(col)] = col_report
             
             # Identify Issues
@@ -76,16 +282,9 @@ class SmartScanner:
                     "details": f"Contains {col_report['numeric_convertible_percent']}% numbers but formatted as text."
                 })
 
-            missing_count = int(col_report.get("missing_count") or 0)
+            missing_count = int(missing_count)
             if missing_count > 0:
-                missing_percent = round((missing_count / max(1, len(df))) * 100, 2)
-                missing_by_column.append({
-                    "column": str(col),
-                    "missing_count": missing_count,
-                    "missing_percent": missing_percent,
-                    "total": int(len(df))
-                })
-
+                missing_percent = float(missing_percent)
                 report["issues"].append({
                     "column": str(col),
                     "type": "missing",
@@ -96,7 +295,15 @@ class SmartScanner:
         # Reorder suggestions
         report["reorder_suggestion"] = self._suggest_order(df, report["columns"])
 
-        missing_by_column.sort(key=lambda x: x["missing_count"], reverse=True)
+        has_missing = missing.to_numpy() > 0
+        missing_df = pd.DataFrame({
+            "column": [str(c) for c in df.columns[has_missing]],
+            "missing_count": missing.to_numpy()[has_missing].astype(int),
+            "missing_percent": missing_pct.to_numpy()[has_missing],
+            "total": int(len(df)),
+        })
+        missing_df = missing_df.sort_values("missing_count", ascending=False, kind="stable")
+        missing_by_column = missing_df.to_dict(orient="records")
         report["missing_report"] = {
             "total_rows": int(len(df)),
             "columns_with_missing": int(len(missing_by_column)),
@@ -116,60 +323,92 @@ class SmartScanner:
         }
 
     def optimize_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
-        out = df.copy()
+        # Collect the new column arrays by position and build the frame once at the
+        # end: no upfront deep copy, no per-assignment block consolidation.
+        new_cols: Dict[int, Any] = {}
 
-        for col in out.columns:
+        for i in range(df.shape[1]):
+            s = df.iloc[:, i]
+            new_cols[i] = s.array
             try:
-                s = out[col]
-
                 if pd.api.types.is_integer_dtype(s.dtype):
-                    out[col] = pd.to_numeric(s, downcast="integer")
+                    new_cols[i] = _downcast(s, "integer")
                     continue
 
                 if pd.api.types.is_float_dtype(s.dtype):
-                    out[col] = pd.to_numeric(s, downcast="float")
+                    new_cols[i] = _downcast(s, "float")
                     continue
 
                 if pd.api.types.is_bool_dtype(s.dtype) or isinstance(s.dtype, pd.CategoricalDtype):
                     continue
 
                 if pd.api.types.is_object_dtype(s.dtype) or pd.api.types.is_string_dtype(s.dtype):
-                    # First ensure all values are strings to avoid type errors
-                    s_str = s.astype(str) if s.dtype == object else s
-                    numeric_converted = pd.to_numeric(s_str, errors="coerce")
                     non_null = s.notna().sum()
-                    numeric_non_null = numeric_converted.notna().sum()
+                    if pd.api.types.infer_dtype(s, skipna=True) == "boolean":
+                        # True/False objects are labels, not 0/1: leave them to the categorical path
+                        numeric_non_null = 0
+                    else:
+                        numeric_non_null = np.count_nonzero(~np.isnan(_coerce_numeric(s)))
 
                     if non_null > 0 and (numeric_non_null / non_null) >= 0.9:
-                        out[col] = pd.to_numeric(s_str, errors="coerce")
-                        if pd.api.types.is_integer_dtype(out[col].dropna().dtype):
-                            out[col] = pd.to_numeric(out[col], downcast="integer")
-                        elif pd.api.types.is_float_dtype(out[col].dtype):
-                            out[col] = pd.to_numeric(out[col], downcast="float")
+                        # Only columns that pass the check are converted by pandas (keeps int dtypes)
+                        numeric_converted = _to_numeric(s)
+                        if pd.api.types.is_integer_dtype(numeric_converted.dtype):
+                            new_cols[i] = _downcast(numeric_converted, "integer")
+                        elif pd.api.types.is_float_dtype(numeric_converted.dtype):
+                            new_cols[i] = _downcast(numeric_converted, "float")
+                        else:
+                            new_cols[i] = numeric_converted.array
                         continue
 
-                    unique_count = int(s.nunique(dropna=True))
+                    # Only the <= 200 threshold matters here, so stop counting past it
+                    unique_count = _bounded_nunique(s.to_numpy(), cap=200)
                     if unique_count > 0:
                         unique_ratio = unique_count / max(1, int(non_null))
                         if unique_count <= 200 and unique_ratio <= 0.2:
-                            out[col] = s.astype("category")
+                            new_cols[i] = pd.Categorical(s)
             except Exception as e:
                 # If optimization fails for a column, leave it unchanged
                 # This handles Excel files with unusual/mixed data types
                 pass
 
+        out = pd.DataFrame(new_cols, index=df.index, copy=False)
+        out.columns = df.columns
         return out
 
-    def _analyze_column(self, series: pd.Series, name: str) -> Dict[str, Any]:
+    def _analyze_column(
+        self,
+        series: pd.Series,
+        name: str,
+        missing_count: Optional[int] = None,
+        unique_count: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
         Deep dive into a single column.
+        missing_count / unique_count may be precomputed frame-wide by scan_dataset.
         """
-        unique_c = series.nunique()
+        # Work on the underlying array; pandas dispatch only where it pays off
+        arr = series.to_numpy()
+        na_mask = pd.isna(arr) if (missing_count is None or unique_count is None) else None
+
+        # Build the unique set once and reuse it for the categories list below;
+        # very long object columns only need the count.
+        uniq = None
+        if unique_count is not None:
+            unique_c = unique_count
+        elif pd.api.types.is_object_dtype(series.dtype) and len(arr) > 100_000:
+            unique_c = int(series.nunique())
+        else:
+            uniq = pd.unique(arr[~na_mask])
+            unique_c = len(uniq)
+
+        if missing_count is None:
+            missing_count = int(na_mask.sum())
         
         stats = {
             "name": name,
             "type": str(series.dtype), # Schema expects "type"
-            "missing_count": int(series.isnull().sum()), # Schema expects "missing_count"
+            "missing_count": missing_count, # Schema expects "missing_count"
             "unique_count": unique_c, # Schema expects "unique_count"
             "total": len(series)
         }
@@ -177,9 +416,10 @@ class SmartScanner:
         # A. Detect Mixed Types (Numbers hidden in Object columns)
         if pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype):
             # Try converting to numeric
-            numeric_converted = pd.to_numeric(series, errors='coerce')
-            num_count = numeric_converted.notna().sum()
-            total_count = len(series)
+            numeric_converted = _coerce_numeric(series)
+            converted_nan = np.isnan(numeric_converted)
+            total_count = len(arr)
+            num_count = total_count - int(converted_nan.sum())
             
             if num_count > 0 and num_count / total_count > 0.5:
                 # Suspicious: >50% are numbers, but it's an object column (likely pollution)
@@ -187,50 +427,107 @@ class SmartScanner:
                 stats["numeric_convertible_percent"] = round((num_count / total_count) * 100, 1)
                 
                 # Find the "Polluters" (values that are NaN after conversion but weren't before)
-                # Note: this is expensive for large sets, so we sample
-                polluters = series[numeric_converted.isna() & series.notna()].unique()[:5]
-                stats["polluting_values"] = [str(x) for x in polluters]
+                stats["polluting_values"] = _first_k_polluters(arr, converted_nan, k=5)
 
         # B. Normality Check (If Numeric)
         if pd.api.types.is_numeric_dtype(series.dtype):
-            is_normal, p_val, _ = check_normality(series)
-            
-            # Shapiro limit check inside check_normality, but result implies:
-            stats["normality"] = {
-                "is_normal": is_normal,
-                "p_value": _safe_float(p_val)
-            }
-            
-            # Simple Desc - use _safe_float to handle inf/nan values
-            stats["mean"] = _safe_float(series.mean())
-            stats["min"] = _safe_float(series.min())
-            stats["max"] = _safe_float(series.max())
-            stats["example"] = _safe_float(series.iloc[0]) if len(series) > 0 else None
+            values = series.to_numpy(dtype=float, na_value=np.nan)
+            is_id = (
+                pd.api.types.is_integer_dtype(series.dtype)
+                and missing_count == 0
+                and 0 < len(arr) == unique_c
+            )
 
-            try:
-                clean = series.replace([np.inf, -np.inf], np.nan).dropna()
-                if len(clean) >= 10:
-                    counts, edges = np.histogram(clean.to_numpy(dtype=float), bins=12)
-                    stats["histogram"] = {
-                        "bins": [int(x) for x in counts.tolist()],
-                        "edges": [_safe_float(x) for x in edges.tolist()],
+            if is_id:
+                # Obvious ID column: normality and histogram carry no meaning
+                stats["id_column"] = True
+                stats["normality"] = {"is_normal": False, "p_value": None}
+                stats["mean"] = _safe_float(values.mean())
+                stats["min"] = _safe_float(values.min())
+                stats["max"] = _safe_float(values.max())
+                stats["example"] = _safe_float(arr[0])
+            else:
+                finite = values[np.isfinite(values)]
+                n_finite = len(finite)
+
+                # Simple Desc + histogram; min/max double as the zero-variance check below.
+                # Columns small enough for Shapiro are sorted once and the sorted array
+                # feeds the summary, the histogram and the normality test.
+                arr_sorted = None
+                if 0 < n_finite <= SHAPIRO_MAX_N:
+                    arr_sorted, summary = _prepare_numeric(finite, 12)
+                elif n_finite > 0:
+                    summary = _numeric_summary(np.ascontiguousarray(finite), 12)
+                else:
+                    summary = None
+
+                # Degenerate inputs: skip Shapiro's sort for empty, constant or mostly-empty columns
+                if summary is None:
+                    # No finite values: nothing to test
+                    stats["normality"] = {"is_normal": False, "p_value": None}
+                elif summary[1] == summary[2]:
+                    stats["normality"] = {"is_normal": False, "p_value": 1.0}
+                elif np.isnan(values).sum() > 0.95 * len(values):
+                    stats["normality"] = {"is_normal": False, "p_value": None}
+                elif n_finite > SHAPIRO_MAX_N:
+                    # Shapiro-Wilk p-values are unreliable past 5000; D'Agostino-Pearson is O(n)
+                    _, p_val = scipy_stats.normaltest(finite)
+                    stats["normality"] = {
+                        "is_normal": bool(p_val > 0.05),
+                        "p_value": _safe_float(p_val)
                     }
-            except Exception:
-                pass
+                elif n_finite < 3:
+                    stats["normality"] = {"is_normal": False, "p_value": 0.0}
+                else:
+                    try:
+                        _, p_val = shapiro_sorted(arr_sorted)
+                    except Exception:
+                        p_val = 0.0
+                    stats["normality"] = {
+                        "is_normal": bool(p_val > 0.05),
+                        "p_value": _safe_float(p_val)
+                    }
+
+                stats["mean"] = stats["min"] = stats["max"] = None
+                stats["example"] = _safe_float(arr[0]) if len(arr) else None
+
+                if summary is not None:
+                    mean, mn, mx, counts, edges = summary
+                    stats["mean"] = _safe_float(mean)
+                    stats["min"] = _safe_float(mn)
+                    stats["max"] = _safe_float(mx)
+                    if n_finite >= 10:
+                        _isfinite = math.isfinite
+                        stats["histogram"] = {
+                            "bins": counts.tolist(),
+                            "edges": [x if _isfinite(x) else None for x in edges.tolist()],
+                        }
 
         # C. Categorical Intelligence
         if pd.api.types.is_object_dtype(series.dtype) or isinstance(series.dtype, pd.CategoricalDtype):
              if unique_c < 20:
-                 stats["categories"] = [str(x) for x in series.dropna().unique()]
+                 if uniq is None:
+                     # One hash pass over the raw array; NaN/None filtered on the few uniques
+                     uniq = [x for x in pd.unique(arr) if not pd.isna(x)]
+                 stats["categories"] = [str(x) for x in uniq]
              try:
-                 top = series.dropna().astype(str).value_counts().head(3)
+                 # Count raw values and stringify only the distinct keys
+                 top = series.value_counts(dropna=True)
+                 top = top[top > 0]
+                 keys = top.index.astype(str)
+                 if keys.is_unique:
+                     top.index = keys
+                 else:
+                     # e.g. 1 and "1" collapse to the same label
+                     top = top.groupby(keys).sum().sort_values(ascending=False, kind="stable")
+                 top = top.head(3)
                  stats["top_values"] = [
                      {"value": str(idx), "count": int(cnt)}
                      for idx, cnt in top.items()
                  ]
              except Exception:
                  pass
-             stats["example"] = str(series.iloc[0]) if len(series) > 0 else None
+             stats["example"] = str(arr[0]) if len(arr) else None
         
         return stats
 
@@ -243,17 +540,20 @@ class SmartScanner:
         cats = []
         nums = []
         others = []
+        n_rows = len(df)
         
-        for col in df.columns:
-            c = str(col)
-            report = col_reports.get(c, {})
-            
+        for c, report in ((str(col), col_reports.get(str(col), {})) for col in df.columns):
             # ID heuristics
-            if "id" in c.lower() or "code" in c.lower() or report.get("unique_count") == len(df):
+            if report.get("id_column"):
+                ids.append(c)
+                continue
+
+            lower = c.lower()
+            if "id" in lower or "code" in lower or report.get("unique_count") == n_rows:
                 ids.append(c)
                 continue
                 
-            dtype = report.get("dtype", "")
+            dtype = report.get("type", "")
             if "int" in dtype or "float" in dtype:
                 nums.append(c)
             elif "object" in dtype or "category" in dtype:
@@ -55,7 +55,28 @@ Usage:
     citation = get_citation("cohens_d")
 """
 
-from typing import Dict, List, Optional, Any
+import bisect
+import collections.abc
+import json
+import math
+import numbers
+import os
+import sys
+import types
+from collections import defaultdict
+from enum import IntEnum
+from functools import lru_cache
+from pathlib import Path
+from string import Formatter
+from typing import Callable, Dict, List, Optional, Any, Mapping, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+try:
+    # Optional: JIT kernel for batch effect-size classification
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 # =============================================================================
@@ -133,408 +154,449 @@ ACADEMIC_REFERENCES: Dict[str, Dict[str, str]] = {
         "note": "Hedges' g correction for small sample bias in Cohen's d"
     }
 }
+ACADEMIC_REFERENCES = types.MappingProxyType(ACADEMIC_REFERENCES)
 
 
 # =============================================================================
-# STATISTICAL TERMS KNOWLEDGE BASE
+# STATISTICAL TERMS AND TEST SELECTION KNOWLEDGE BASE
 # =============================================================================
+# The data lives in data/stat_knowledge.json ("terms" / "tests") and is parsed
+# once at import. STAT_TERMS holds the numeric schema only; the "definition" /
+# "common_mistakes" texts are in stat_terms_ru and are merged in by
+# STAT_TERMS_FULL on demand.
 
-STAT_TERMS: Dict[str, Dict[str, Any]] = {
-    
-    # -------------------------------------------------------------------------
-    # Core Concepts
-    # -------------------------------------------------------------------------
-    
-    "p_value": {
-        "term": "P-value",
-        "term_ru": "P-значение",
-        "definition": {
-            "junior": "Чем меньше p-value, тем сильнее доказательства против нулевой гипотезы. Обычно сравнивают с 0.05.",
-            "mid": "Вероятность получить статистику ≥ наблюдаемой при условии, что H0 верна. Зависит от размера выборки.",
-            "senior": "P(data|H0). Не путать с P(H0|data). При большом n даже trivial эффекты дают p < 0.05. Рассматривать вместе с effect size и CI."
-        },
-        "common_mistakes": [
-            "p-value ≠ вероятность что H0 верна",
-            "p < 0.05 ≠ практическая значимость",
-            "p > 0.05 ≠ 'эффекта нет' (может быть недостаток мощности)"
-        ],
-        "what_to_check": ["effect_size", "confidence_interval", "power"],
-        "emoji": "📊"
-    },
-    
-    "effect_size": {
-        "term": "Effect Size",
-        "term_ru": "Размер эффекта",
-        "definition": {
-            "junior": "Насколько большой эффект мы нашли. Не зависит от размера выборки.",
-            "mid": "Стандартизированная мера силы эффекта. Cohen's d = разница средних / pooled SD.",
-            "senior": "Позволяет сравнивать результаты между исследованиями. Для метаанализа важнее p-value."
-        },
-        "thresholds": {
-            "cohens_d": {
-                "negligible": {"max": 0.2, "label": "незначительный"},
-                "small": {"max": 0.5, "label": "малый"},
-                "medium": {"max": 0.8, "label": "средний"},
-                "large": {"min": 0.8, "label": "большой"}
-            },
-            "eta_squared": {
-                "small": {"max": 0.06, "label": "малый"},
-                "medium": {"max": 0.14, "label": "средний"},
-                "large": {"min": 0.14, "label": "большой"}
-            },
-            "partial_eta_squared": {
-                "small": {"max": 0.06, "label": "малый"},
-                "medium": {"max": 0.14, "label": "средний"},
-                "large": {"min": 0.14, "label": "большой"}
-            },
-            "r": {
-                "weak": {"max": 0.3, "label": "слабая связь"},
-                "moderate": {"max": 0.5, "label": "умеренная связь"},
-                "strong": {"min": 0.5, "label": "сильная связь"}
-            }
-        },
-        "common_mistakes": [
-            "Игнорирование effect size при significant p-value",
-            "Использование только p-value для выводов"
-        ],
-        "emoji": "📏"
-    },
-    
-    "power": {
-        "term": "Statistical Power",
-        "term_ru": "Мощность теста",
-        "definition": {
-            "junior": "Вероятность обнаружить эффект, если он реально существует. Рекомендуется ≥ 80%.",
-            "mid": "Power = 1 - β, где β — вероятность ошибки II рода (пропустить реальный эффект). Зависит от n, effect size, alpha.",
-            "senior": "При power = 0.8 и реальном эффекте — 20% шанс получить p > 0.05. Post-hoc power analysis имеет ограничения."
-        },
-        "recommendations": {
-            "low": {"max": 0.5, "message": "Критически низкая мощность. Увеличьте выборку."},
-            "insufficient": {"max": 0.8, "message": "Недостаточная мощность. Рекомендуется ≥ 80%."},
-            "adequate": {"max": 0.95, "message": "Адекватная мощность."},
-            "high": {"min": 0.95, "message": "Высокая мощность. Возможно, выборка избыточна."}
-        },
-        "emoji": "⚡"
-    },
-    
-    "alpha": {
-        "term": "Alpha Level",
-        "term_ru": "Уровень значимости",
-        "definition": {
-            "junior": "Порог для принятия решения. Обычно 0.05 (5%). Если p < alpha — результат значимый.",
-            "mid": "Вероятность ошибки I рода (ложноположительный результат). При alpha = 0.05 в 5% случаев отвергаем верную H0.",
-            "senior": "При множественных сравнениях нужна коррекция (Bonferroni, FDR). В некоторых областях используют alpha = 0.005."
-        },
-        "emoji": "🎯"
-    },
-    
-    "confidence_interval": {
-        "term": "Confidence Interval",
-        "term_ru": "Доверительный интервал",
-        "definition": {
-            "junior": "Диапазон, в котором с 95% уверенностью находится истинное значение параметра.",
-            "mid": "При повторении эксперимента 100 раз, ~95 CI из 100 захватят истинное значение.",
-            "senior": "CI для effect size важнее CI для mean. Если CI не включает 0 — эффект значим на данном alpha."
-        },
-        "emoji": "📐"
-    },
-    
-    # -------------------------------------------------------------------------
-    # Assumptions
-    # -------------------------------------------------------------------------
-    
-    "normality": {
-        "term": "Normality Assumption",
-        "term_ru": "Допущение нормальности",
-        "definition": {
-            "junior": "Данные должны быть примерно нормально распределены для t-test и ANOVA.",
-            "mid": "Благодаря ЦПТ, при n > 30 распределение средних приближается к нормальному. Для малых n — проверяйте Shapiro-Wilk.",
-            "senior": "T-test устойчив к нарушениям нормальности при равных n и симметричных распределениях. Критичнее для малых выборок."
-        },
-        "how_to_check": "Shapiro-Wilk test (p > 0.05 → нормальность), Q-Q plot",
-        "if_violated": "Используйте непараметрические тесты (Mann-Whitney, Kruskal-Wallis) или bootstrap",
-        "emoji": "📈"
-    },
-    
-    "homogeneity": {
-        "term": "Homogeneity of Variance",
-        "term_ru": "Гомогенность дисперсий",
-        "definition": {
-            "junior": "Дисперсии в сравниваемых группах должны быть примерно одинаковыми.",
-            "mid": "Levene's test проверяет равенство дисперсий. При нарушении — используйте Welch's correction.",
-            "senior": "ANOVA устойчив к нарушениям при равных n. При неравных n и гетероскедастичности — Welch ANOVA или Games-Howell post-hoc."
-        },
-        "how_to_check": "Levene's test (p > 0.05 → дисперсии равны)",
-        "if_violated": "Welch's t-test или Welch's ANOVA",
-        "emoji": "⚖️"
-    },
-    
-    "independence": {
-        "term": "Independence of Observations",
-        "term_ru": "Независимость наблюдений",
-        "definition": {
-            "junior": "Каждое наблюдение не должно зависеть от других.",
-            "mid": "Нарушается при repeated measures, кластерных данных, временных рядах.",
-            "senior": "Для зависимых данных — paired tests, mixed models, GEE. При сетевых эффектах — cluster-robust SE."
-        },
-        "examples_violated": [
-            "Несколько измерений от одного пациента",
-            "Студенты из одного класса",
-            "Временные ряды"
-        ],
-        "emoji": "🔗"
-    },
-    
-    # -------------------------------------------------------------------------
-    # Effect Size Types
-    # -------------------------------------------------------------------------
-    
-    "cohens_d": {
-        "term": "Cohen's d",
-        "term_ru": "d Коэна",
-        "definition": {
-            "junior": "Разница между группами в единицах стандартного отклонения.",
-            "mid": "d = (M1 - M2) / SD_pooled. Интерпретация: 0.2 малый, 0.5 средний, 0.8 большой.",
-            "senior": "Hedges' g — коррекция для малых выборок. Glass's Δ — когда SD групп различаются существенно."
-        },
-        "formula": "d = (M₁ - M₂) / SD_pooled",
-        "practical_meaning": {
-            0.2: "~58% группы A выше среднего группы B",
-            0.5: "~69% группы A выше среднего группы B",
-            0.8: "~79% группы A выше среднего группы B"
-        },
-        "emoji": "📊"
-    },
-    
-    "eta_squared": {
-        "term": "Eta-squared (η²)",
-        "term_ru": "Эта-квадрат",
-        "definition": {
-            "junior": "Доля дисперсии, объясняемая фактором. Аналог R² для ANOVA.",
-            "mid": "η² = SS_between / SS_total. Partial η² учитывает только relevant variance.",
-            "senior": "η² переоценивает effect в выборке. ω² — менее смещённая оценка для популяции."
-        },
-        "formula": "η² = SS_between / SS_total",
-        "emoji": "📐"
-    },
+_DATA_PATH = Path(__file__).with_name("data") / "stat_knowledge.json"
 
-    "multiple_comparison": {
-        "term": "Multiple Comparison Correction",
-        "term_ru": "Коррекция на множественные сравнения",
-        "definition": {
-            "junior": "Когда делаешь много тестов, шанс ложной находки растёт. Коррекция это исправляет.",
-            "mid": "При 20 тестах с α=0.05 ожидается 1 ложноположительный. FDR контролирует долю ложных среди значимых.",
-            "senior": "FWER vs FDR. Bonferroni: α/n, очень консервативен. BH: step-up, контролирует E[V/R]. BY: для зависимых тестов."
-        },
-        "methods": {
-            "bonferroni": {
-                "name": "Bonferroni",
-                "formula": "α_adj = α / n",
-                "description_ru": "Самый строгий. Делит α на число тестов.",
-                "when_to_use": "Когда ложноположительный результат недопустим"
-            },
-            "holm": {
-                "name": "Holm-Bonferroni",
-                "description_ru": "Чуть мягче Bonferroni. Step-down процедура.",
-                "when_to_use": "Когда Bonferroni слишком консервативен"
-            },
-            "bh": {
-                "name": "Benjamini-Hochberg",
-                "description_ru": "FDR контроль. Контролирует долю ложных находок.",
-                "when_to_use": "Исследовательский анализ, много тестов"
-            },
-            "by": {
-                "name": "Benjamini-Yekutieli",
-                "description_ru": "FDR для зависимых тестов.",
-                "when_to_use": "Когда тесты коррелируют между собой"
-            }
-        },
-        "recommendation": "Для исследовательского анализа: BH-FDR. Для подтверждающего: Bonferroni или Holm.",
-        "common_mistakes": [
-            "Не корректировать при множественных сравнениях",
-            "Использовать Bonferroni когда BH достаточно",
-            "Путать FWER и FDR"
-        ],
-        "emoji": "🔢"
-    }
+
+class _Meta(collections.abc.Mapping):
+    """
+    Read-only knowledge-base record.
+
+    Fields are slot attributes (meta.emoji); the Mapping interface
+    (meta["emoji"], meta.get(...), "x" in meta) is kept for dict-era callers.
+    Fields absent from the source data are None and do not appear as keys.
+    """
+    __slots__ = ()
+
+    def __init__(self, **fields: Any) -> None:
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(f"{type(self).__name__}: unknown fields {sorted(fields)}")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        return (name for name in self.__slots__ if getattr(self, name) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class Band(NamedTuple):
+    """One effect-size band; |value| in (lo, hi] gets `label` (the first band also takes 0)."""
+    lo: float
+    hi: float
+    label: str
+
+
+def _to_bands(bands: Dict[str, Dict[str, Any]]) -> Tuple[Band, ...]:
+    """{"max"/"min", "label"} band dicts from the JSON -> Bands sorted by upper bound."""
+    out: List[Band] = []
+    lo = 0.0
+    for b in sorted(bands.values(), key=lambda b: b.get("max", math.inf)):
+        hi = b.get("max", math.inf)
+        out.append(Band(lo, hi, b["label"]))
+        lo = hi
+    return tuple(out)
+
+
+class CorrectionMethod(NamedTuple):
+    """A multiple-comparison correction as listed under multiple_comparison.methods."""
+    key: str
+    name: str
+    description_ru: str
+    when_to_use: str
+    formula: str = ""
+
+
+class TermMeta(_Meta):
+    __slots__ = (
+        "emoji", "formula", "what_to_check", "thresholds",
+        "recommendations", "how_to_check", "if_violated", "examples_violated",
+        "practical_meaning", "methods", "recommendation",
+    )
+
+
+class TestMeta(_Meta):
+    __slots__ = (
+        "name", "name_ru", "emoji", "when_to_use", "assumptions", "why_it_works",
+        "alternatives", "effect_size", "post_hoc",
+    )
+
+
+# Strings shorter than this are interned; longer ones are only deduplicated.
+_INTERN_MAX_LEN = 256
+
+
+def _freeze(obj: Any, pool: Dict[Any, Any]) -> Any:
+    """
+    JSON lists -> tuples, dict keys interned, and equal strings / tuples
+    canonicalised through `pool` so every duplicate shares one object.
+    """
+    if isinstance(obj, str):
+        return pool.setdefault(obj, sys.intern(obj) if len(obj) < _INTERN_MAX_LEN else obj)
+    if isinstance(obj, dict):
+        return {sys.intern(k): _freeze(v, pool) for k, v in obj.items()}
+    if isinstance(obj, list):
+        t = tuple(_freeze(v, pool) for v in obj)
+        return pool.setdefault(t, t)
+    return obj
+
+
+def _load_knowledge() -> Tuple[Dict[str, Dict[str, str]], Dict[str, TermMeta], Dict[str, TestMeta]]:
+    raw = json.loads(_DATA_PATH.read_bytes())
+    pool: Dict[Any, Any] = {}
+    names = _freeze(raw["names"], pool)
+    terms = _freeze(raw["terms"], pool)
+    tests = _freeze(raw["tests"], pool)
+    # Band tuples go through the pool too, so identical tables
+    # (eta_squared / partial_eta_squared) share one object.
+    thresholds = terms["effect_size"]["thresholds"]
+    for metric, bands in thresholds.items():
+        compiled = _to_bands(bands)
+        thresholds[metric] = pool.setdefault(compiled, compiled)
+    mc = terms["multiple_comparison"]
+    mc["methods"] = {key: CorrectionMethod(key, **m) for key, m in mc["methods"].items()}
+    return (
+        names,
+        {k: TermMeta(**v) for k, v in terms.items()},
+        {k: TestMeta(**v) for k, v in tests.items()},
+    )
+
+
+_names, _terms, _tests = _load_knowledge()
+
+# Read-only views: consumers only ever look up, and keys are interned for pointer-compare hits
+STAT_TERMS: Mapping[str, TermMeta] = types.MappingProxyType(_terms)
+TEST_KNOWLEDGE: Mapping[str, TestMeta] = types.MappingProxyType(_tests)
+del _terms, _tests
+
+# Correction methods in data order, for dropdowns and reports.
+CORRECTION_METHODS: Tuple[CorrectionMethod, ...] = tuple(STAT_TERMS["multiple_comparison"].methods.values())
+
+# Display names per locale ("en" / "ru"); STAT_LOCALE picks the default one.
+LOCALE = os.environ.get("STAT_LOCALE", "ru")
+_NAMES_EN: Dict[str, str] = _names["en"]
+_NAMES_RU: Dict[str, str] = _names["ru"]
+del _names
+
+
+def term_name(key: str, locale: Optional[str] = None) -> str:
+    """Display name of a term in the given locale (default LOCALE); the key itself if unknown."""
+    names = _NAMES_RU if (locale or LOCALE) == "ru" else _NAMES_EN
+    return names.get(key, key)
+
+EXPLANATION_LEVELS = ("junior", "mid", "senior")
+
+# Flat (key, level) -> text tables: one hash probe instead of two nested lookups.
+# A missing level falls back to the junior text, as the API functions always did.
+# Term definitions live in stat_terms_ru and are indexed on first use.
+_DEFINITION_INDEX: Optional[Dict[tuple, str]] = None
+_RATIONALE_INDEX: Dict[tuple, str] = {
+    (t, lvl): d["why_it_works"].get(lvl, d["why_it_works"].get("junior", ""))
+    for t, d in TEST_KNOWLEDGE.items() if "why_it_works" in d
+    for lvl in EXPLANATION_LEVELS
 }
 
 
-# =============================================================================
-# TEST SELECTION RATIONALE
-# =============================================================================
+def _load_definitions() -> Dict[tuple, str]:
+    global _DEFINITION_INDEX
+    if _DEFINITION_INDEX is None:
+        from . import stat_terms_ru
+        pool: Dict[Any, Any] = {}
+        _DEFINITION_INDEX = {
+            (t, lvl): _freeze(d["definition"].get(lvl, d["definition"].get("junior", "")), pool)
+            for t, d in stat_terms_ru.DEFINITIONS.items() if "definition" in d
+            for lvl in EXPLANATION_LEVELS
+        }
+    return _DEFINITION_INDEX
 
-TEST_KNOWLEDGE: Dict[str, Dict[str, Any]] = {
-    
-    "t_test_ind": {
-        "name": "Independent Samples t-test",
-        "name_ru": "T-test для независимых выборок",
-        "when_to_use": [
-            "2 независимые группы",
-            "Numeric outcome (непрерывная переменная)",
-            "Нормальное распределение (или n > 30)",
-            "Примерно равные дисперсии"
-        ],
-        "assumptions": ["normality", "homogeneity", "independence"],
-        "why_it_works": {
-            "junior": "Сравнивает средние двух групп и проверяет, значима ли разница.",
-            "mid": "Использует t-распределение. При n → ∞ приближается к z-test благодаря ЦПТ.",
-            "senior": "Pooled variance estimate предполагает σ₁ = σ₂. При нарушении — Welch's correction с Satterthwaite df."
-        },
-        "alternatives": {
-            "non_normal": {"test": "mann_whitney", "reason": "если данные ненормальные"},
-            "unequal_variance": {"test": "welch_t_test", "reason": "если дисперсии различаются"},
-            "small_n": {"test": "permutation_test", "reason": "если n < 15 и ненормально"}
-        },
-        "effect_size": "cohens_d",
-        "emoji": "📊"
-    },
-    
-    "welch_t_test": {
-        "name": "Welch's t-test",
-        "name_ru": "T-test Уэлча",
-        "when_to_use": [
-            "2 независимые группы",
-            "Дисперсии могут различаться",
-            "Более robust чем Student's t-test"
-        ],
-        "assumptions": ["normality", "independence"],
-        "why_it_works": {
-            "junior": "Как обычный t-test, но не требует равных дисперсий.",
-            "mid": "Использует Satterthwaite approximation для degrees of freedom.",
-            "senior": "По умолчанию рекомендуется вместо Student's t-test (Delacre et al., 2017)."
-        },
-        "effect_size": "cohens_d",
-        "emoji": "📊"
-    },
-    
-    "mann_whitney": {
-        "name": "Mann-Whitney U test",
-        "name_ru": "U-тест Манна-Уитни",
-        "when_to_use": [
-            "2 независимые группы",
-            "Ненормальное распределение",
-            "Ordinal или skewed numeric данные"
-        ],
-        "assumptions": ["independence"],
-        "why_it_works": {
-            "junior": "Сравнивает ранги (порядок) вместо средних. Не требует нормальности.",
-            "mid": "Тестирует H0: P(X > Y) = 0.5. Эквивалентен Wilcoxon rank-sum test.",
-            "senior": "Чувствителен к различиям в форме распределений. При разных формах интерпретация ≠ 'разница медиан'."
-        },
-        "effect_size": "rank_biserial",
-        "emoji": "📊"
-    },
-    
-    "anova": {
-        "name": "One-way ANOVA",
-        "name_ru": "Однофакторный дисперсионный анализ",
-        "when_to_use": [
-            "3+ независимых групп",
-            "Нормальное распределение",
-            "Равные дисперсии"
-        ],
-        "assumptions": ["normality", "homogeneity", "independence"],
-        "why_it_works": {
-            "junior": "Проверяет, есть ли различия между группами. Если p < 0.05 — хотя бы одна пара различается.",
-            "mid": "F = MS_between / MS_within. Сравнивает вариацию между группами с вариацией внутри групп.",
-            "senior": "ANOVA = special case of linear regression. Robust к нарушениям нормальности при равных n."
-        },
-        "post_hoc": ["tukey", "bonferroni", "holm"],
-        "alternatives": {
-            "unequal_variance": {"test": "welch_anova", "reason": "если дисперсии различаются"},
-            "non_normal": {"test": "kruskal_wallis", "reason": "если данные ненормальные"}
-        },
-        "effect_size": "eta_squared",
-        "emoji": "📈"
-    },
-    
-    "kruskal_wallis": {
-        "name": "Kruskal-Wallis H test",
-        "name_ru": "H-тест Краскела-Уоллиса",
-        "when_to_use": [
-            "3+ независимых групп",
-            "Ненормальное распределение",
-            "Ordinal или skewed данные"
-        ],
-        "assumptions": ["independence"],
-        "why_it_works": {
-            "junior": "Непараметрический аналог ANOVA. Сравнивает ранги вместо средних.",
-            "mid": "H-статистика основана на сумме квадратов рангов.",
-            "senior": "Post-hoc: Dunn's test с коррекцией на множественные сравнения."
-        },
-        "effect_size": "epsilon_squared",
-        "emoji": "📈"
-    },
-    
-    "chi_square": {
-        "name": "Chi-squared test",
-        "name_ru": "Хи-квадрат тест",
-        "when_to_use": [
-            "Две категориальные переменные",
-            "Таблица частот",
-            "Expected count ≥ 5 в каждой ячейке"
-        ],
-        "assumptions": ["independence", "expected_count_>=5"],
-        "why_it_works": {
-            "junior": "Проверяет связь между двумя категориальными переменными.",
-            "mid": "χ² = Σ(O - E)² / E. Сравнивает наблюдаемые частоты с ожидаемыми при независимости.",
-            "senior": "При 2×2 — Yates correction или Fisher's exact. При large samples — χ² robust."
-        },
-        "alternatives": {
-            "small_sample": {"test": "fisher_exact", "reason": "если expected count < 5"}
-        },
-        "effect_size": "cramers_v",
-        "emoji": "📊"
-    },
-    
-    "pearson": {
-        "name": "Pearson correlation",
-        "name_ru": "Корреляция Пирсона",
-        "when_to_use": [
-            "Две непрерывные переменные",
-            "Линейная связь",
-            "Bivariate normality"
-        ],
-        "assumptions": ["normality", "linearity", "homoscedasticity"],
-        "why_it_works": {
-            "junior": "Измеряет силу линейной связи от -1 до +1.",
-            "mid": "r = cov(X,Y) / (SD_X × SD_Y). Чувствителен к outliers.",
-            "senior": "r² = доля объяснённой дисперсии. Не улавливает нелинейные связи."
-        },
-        "alternatives": {
-            "non_linear": {"test": "spearman", "reason": "для монотонных нелинейных связей"},
-            "outliers": {"test": "spearman", "reason": "более robust к выбросам"}
-        },
-        "effect_size": "r",
-        "emoji": "📈"
-    },
-    
-    "spearman": {
-        "name": "Spearman correlation",
-        "name_ru": "Корреляция Спирмена",
-        "when_to_use": [
-            "Ordinal данные",
-            "Ненормальное распределение",
-            "Монотонная (не обязательно линейная) связь"
-        ],
-        "assumptions": ["monotonic_relationship"],
-        "why_it_works": {
-            "junior": "Корреляция по рангам. Более устойчив к выбросам.",
-            "mid": "ρ = Pearson r для рангов. Улавливает монотонные нелинейные связи.",
-            "senior": "При tied ranks — коррекция. Для ordinal данных предпочтительнее Pearson."
-        },
-        "effect_size": "rho",
-        "emoji": "📈"
-    }
+
+def get_definition(term: str, level: str = "junior") -> Optional[str]:
+    """Definition of a term at the given level (None for unknown terms)."""
+    return _load_definitions().get((term, level))
+
+
+def get_common_mistakes(term: str) -> Tuple[str, ...]:
+    """Common interpretation mistakes for a term (empty if none are recorded)."""
+    from . import stat_terms_ru
+    return stat_terms_ru.DEFINITIONS.get(term, {}).get("common_mistakes", ())
+
+
+@lru_cache(maxsize=1024)
+def render_term(term: str, level: str = "junior", locale: Optional[str] = None) -> str:
+    """
+    One-block text rendering of a term: "<emoji> <name>\n<definition>".
+
+    Cached: the knowledge base is read-only, so the result never changes.
+    """
+    meta = STAT_TERMS.get(term)
+    if meta is None:
+        return term
+    name = term_name(term, locale)
+    definition = get_definition(term, level) or get_definition(term, "junior") or ""
+    return f"{meta.emoji or '📊'} {name}\n{definition}"
+
+
+_STAT_TERMS_FULL: Optional[Mapping[str, Dict[str, Any]]] = None
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: STAT_TERMS_FULL merges the lazily loaded texts into copies of
+    # the term entries, leaving the lightweight STAT_TERMS untouched.
+    global _STAT_TERMS_FULL
+    if name == "STAT_TERMS_FULL":
+        if _STAT_TERMS_FULL is None:
+            from . import stat_terms_ru
+            _STAT_TERMS_FULL = types.MappingProxyType({
+                t: {**d, "term": _NAMES_EN[t], "term_ru": _NAMES_RU[t], **stat_terms_ru.DEFINITIONS.get(t, {})}
+                for t, d in STAT_TERMS.items()
+            })
+        return _STAT_TERMS_FULL
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_rationale(test_id: str, level: str = "junior") -> Optional[str]:
+    """Explanation of why a test works, at the given level (None for unknown tests)."""
+    return _RATIONALE_INDEX.get((test_id, level))
+
+
+def _compile_bands(bands: Dict[str, Dict[str, Any]]) -> tuple:
+    """Turn a {"max"/"min"} band dict into parallel (upper cuts, band names) lists."""
+    items = sorted(bands.items(), key=lambda kv: kv[1].get("max", math.inf))
+    cuts = [b.get("max", math.inf) for _, b in items]
+    values = [name for name, _ in items]
+    return cuts, values
+
+
+# Effect-size bands are upper-inclusive (d = 0.2 is still "negligible"), hence
+# bisect_left; power bands are upper-exclusive (power = 0.8 is "adequate").
+_CLASSIFIERS: Dict[str, tuple] = {
+    metric: ([b.hi for b in bands], [b.label for b in bands])
+    for metric, bands in STAT_TERMS["effect_size"].thresholds.items()
+}
+_POWER_BANDS = _compile_bands(STAT_TERMS["power"].recommendations)
+
+
+def _band_label(compiled: tuple, abs_value: float) -> str:
+    if abs_value != abs_value:
+        return "unknown"
+    cuts, labels = compiled
+    return labels[min(bisect.bisect_left(cuts, abs_value), len(labels) - 1)]
+
+
+def classify_effect_size(metric: str, value: float) -> str:
+    """Russian label of the band |value| falls into ("unknown" for unknown metrics/NaN)."""
+    compiled = _CLASSIFIERS.get(metric)
+    if compiled is None:
+        return "unknown"
+    return _band_label(compiled, abs(value))
+
+
+# get_effect_size_interpretation reads eta-squared on the partial-eta-squared scale
+_EFFECT_TYPE_ALIASES = {
+    k: v for k, v in {"eta_squared": "partial_eta_squared"}.items() if v in _CLASSIFIERS
+}
+
+# Indexed by sign + 1; NaN compares false both ways and lands on "none"
+_SIGN_LABEL = ("negative", "none", "positive")
+
+
+# Array form of the same bands for batch classification: finite cuts plus an
+# object array of labels with "unknown" appended for NaN inputs.
+_CLASSIFIER_ARRAYS: Dict[str, tuple] = {
+    metric: (np.asarray(cuts[:-1], dtype=float), np.array([*labels, "unknown"], dtype=object))
+    for metric, (cuts, labels) in _CLASSIFIERS.items()
+}
+
+
+def _band_indices_numpy(values: np.ndarray, cuts: np.ndarray, nan_index: int) -> np.ndarray:
+    a = np.abs(values)
+    idx = np.searchsorted(cuts, a, side="left")
+    idx[np.isnan(a)] = nan_index
+    return idx
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _band_indices_jit(values, cuts, nan_index):
+        # abs, NaN check and the (2-3 cut) band search fused into one pass
+        out = np.empty(values.shape[0], dtype=np.intp)
+        m = cuts.shape[0]
+        for i in range(values.shape[0]):
+            v = abs(values[i])
+            if v != v:
+                out[i] = nan_index
+                continue
+            j = 0
+            while j < m and v > cuts[j]:
+                j += 1
+            out[i] = j
+        return out
+
+
+def classify_many(metric: str, values: Sequence[float]) -> np.ndarray:
+    """Vectorised classify_effect_size over a whole batch of values."""
+    a = np.asarray(values, dtype=float)
+    compiled = _CLASSIFIER_ARRAYS.get(metric)
+    if compiled is None:
+        return np.full(a.shape, "unknown", dtype=object)
+    cuts, labels = compiled
+    if njit is not None:
+        idx = _band_indices_jit(a.ravel(), cuts, len(labels) - 1).reshape(a.shape)
+    else:
+        idx = _band_indices_numpy(a, cuts, len(labels) - 1)
+    return labels[idx]
+
+
+# (|d| anchor, meaning) pairs, sorted by anchor.
+_PRACTICAL_D = STAT_TERMS["cohens_d"].practical_meaning
+# Midpoints between neighbouring anchors: the nearest anchor is a single bisect away.
+_PRACTICAL_D_MIDS = tuple((a + b) / 2 for (a, _), (b, _) in zip(_PRACTICAL_D, _PRACTICAL_D[1:]))
+_PRACTICAL_D_TEXTS = tuple(text for _, text in _PRACTICAL_D)
+
+
+def practical_meaning_d(d: float) -> str:
+    """Meaning of the Cohen's d anchor nearest to |d| (ties go to the lower anchor)."""
+    d = abs(d)
+    if d != d or not _PRACTICAL_D_TEXTS:
+        return ""
+    return _PRACTICAL_D_TEXTS[bisect.bisect_left(_PRACTICAL_D_MIDS, d)]
+
+
+# Test-selection decision table: (n_groups, normal, equal_var, paired, dv) -> TEST_KNOWLEDGE key.
+# n_groups is 0 for association between two numeric variables and is capped at 3.
+# The when_to_use lists stay as human-readable text only.
+_TEST_LOOKUP: Dict[Tuple[int, bool, bool, bool, str], str] = {}
+
+
+def _reg(test_id: str, k: int, norm: Optional[bool], eqv: Optional[bool],
+         paired: bool = False, dv: str = "numeric") -> None:
+    # None on an axis means the test does not depend on it.
+    for n in ((True, False) if norm is None else (norm,)):
+        for e in ((True, False) if eqv is None else (eqv,)):
+            _TEST_LOOKUP[(k, n, e, paired, dv)] = test_id
+
+
+_reg("t_test_ind", 2, True, True)
+_reg("welch_t_test", 2, True, False)
+_reg("mann_whitney", 2, False, None)
+_reg("anova", 3, True, True)
+_reg("kruskal_wallis", 3, False, None)
+_reg("pearson", 0, True, None)
+_reg("spearman", 0, False, None)
+for _k in (0, 2, 3):
+    _reg("chi_square", _k, None, None, dv="categorical")
+
+
+def select_test(
+    n_groups: int,
+    is_normal: bool,
+    equal_var: bool = True,
+    paired: bool = False,
+    dv: str = "numeric",
+) -> Optional[str]:
+    """TEST_KNOWLEDGE key for the given design, or None if no test is registered."""
+    return _TEST_LOOKUP.get((min(n_groups, 3), bool(is_normal), bool(equal_var), bool(paired), dv))
+
+
+class AltReason(IntEnum):
+    """Why an alternative test is suggested; values index the _ALT_VECTORS tuples."""
+    NON_NORMAL = 0
+    UNEQUAL_VARIANCE = 1
+    SMALL_N = 2
+    SMALL_SAMPLE = 3
+    NON_LINEAR = 4
+    OUTLIERS = 5
+
+
+def _alt_vector(alternatives: Optional[Mapping[str, Dict[str, str]]]) -> Tuple[Optional[str], ...]:
+    # Built from the readable "alternatives" dicts; an unknown reason key fails at import.
+    vec: List[Optional[str]] = [None] * len(AltReason)
+    for key, alt in (alternatives or {}).items():
+        vec[AltReason[key.upper()]] = alt["test"]
+    return tuple(vec)
+
+
+_ALT_VECTORS: Dict[str, Tuple[Optional[str], ...]] = {
+    test_id: _alt_vector(meta.alternatives) for test_id, meta in TEST_KNOWLEDGE.items()
 }
 
 
+def alternative_for(test_id: str, reason: AltReason) -> Optional[str]:
+    """Alternative test suggested for test_id when `reason` applies (None if there is none)."""
+    vec = _ALT_VECTORS.get(test_id)
+    return vec[reason] if vec is not None else None
+
+
+def _invert(field: str) -> Dict[str, Tuple[str, ...]]:
+    """value -> tests whose TEST_KNOWLEDGE[field] contains (or equals) that value."""
+    inverted: Dict[str, List[str]] = defaultdict(list)
+    for test_id, meta in TEST_KNOWLEDGE.items():
+        values = meta.get(field) or ()
+        if isinstance(values, str):
+            values = (values,)
+        elif isinstance(values, Mapping):
+            values = [alt["test"] for alt in values.values()]
+        for value in values:
+            inverted[value].append(test_id)
+    return {value: tuple(ids) for value, ids in inverted.items()}
+
+
+# Reverse lookups ("which tests break if normality fails?") precomputed once.
+_TESTS_BY_ASSUMPTION = _invert("assumptions")
+_TESTS_BY_POST_HOC = _invert("post_hoc")
+_TESTS_BY_EFFECT_SIZE = _invert("effect_size")
+_TESTS_SUGGESTING = _invert("alternatives")
+
+
+def tests_requiring(assumption: str) -> Tuple[str, ...]:
+    """Tests that list the given assumption."""
+    return _TESTS_BY_ASSUMPTION.get(assumption, ())
+
+
+def tests_with_post_hoc(method: str) -> Tuple[str, ...]:
+    """Tests that offer the given post-hoc procedure."""
+    return _TESTS_BY_POST_HOC.get(method, ())
+
+
+def tests_reporting(effect_size: str) -> Tuple[str, ...]:
+    """Tests that report the given effect-size measure."""
+    return _TESTS_BY_EFFECT_SIZE.get(effect_size, ())
+
+
+def tests_suggesting(alternative: str) -> Tuple[str, ...]:
+    """Tests that name the given test as an alternative."""
+    return _TESTS_SUGGESTING.get(alternative, ())
+
+
 # =============================================================================
 # API FUNCTIONS
 # =============================================================================
 
-def get_explanation(term: str, level: str = "junior") -> Optional[Dict[str, Any]]:
+@lru_cache(maxsize=512)
+def get_explanation(term: str, level: str = "junior") -> Optional[Mapping[str, Any]]:
     """
     Get explanation for a statistical term at specified level.
     
@@ -543,29 +605,57 @@ def get_explanation(term: str, level: str = "junior") -> Optional[Dict[str, Any]
         level: "junior", "mid", or "senior"
     
     Returns:
-        Dictionary with term, definition, common_mistakes, etc.
+        Read-only mapping with term, definition, common_mistakes, etc.
+        Cached per (term, level).
     """
-    if term not in STAT_TERMS:
+    knowledge = STAT_TERMS.get(term)
+    if knowledge is None:
         return None
     
-    knowledge = STAT_TERMS[term]
-    definition = knowledge.get("definition", {})
+    definitions = _load_definitions()
+    definition = definitions.get((term, level))
+    if definition is None:
+        definition = definitions.get((term, "junior"), "")
     
-    return {
-        "term": knowledge.get("term", term),
-        "term_ru": knowledge.get("term_ru", term),
-        "definition": definition.get(level, definition.get("junior", "")),
-        "common_mistakes": knowledge.get("common_mistakes", []),
-        "what_to_check": knowledge.get("what_to_check", []),
-        "emoji": knowledge.get("emoji", "📊")
-    }
+    return types.MappingProxyType({
+        "term": term_name(term, "en"),
+        "term_ru": term_name(term, "ru"),
+        "definition": definition,
+        "common_mistakes": get_common_mistakes(term),
+        "what_to_check": knowledge.what_to_check or (),
+        "emoji": knowledge.emoji or "📊"
+    })
+
+
+@lru_cache(maxsize=512)
+def _test_rationale(test_id: str, level: str) -> Optional[Mapping[str, Any]]:
+    """The data-independent part of get_test_rationale, cached per (test_id, level)."""
+    knowledge = TEST_KNOWLEDGE.get(test_id)
+    if knowledge is None:
+        return None
+    
+    why = _RATIONALE_INDEX.get((test_id, level))
+    if why is None:
+        why = _RATIONALE_INDEX.get((test_id, "junior"), "")
+    
+    return types.MappingProxyType({
+        "test_id": test_id,
+        "name": knowledge.name or test_id,
+        "name_ru": knowledge.name_ru or test_id,
+        "when_to_use": knowledge.when_to_use or (),
+        "why_it_works": why,
+        "assumptions": knowledge.assumptions or (),
+        "alternatives": knowledge.alternatives or {},
+        "effect_size": knowledge.effect_size,
+        "emoji": knowledge.emoji or "📊"
+    })
 
 
 def get_test_rationale(
     test_id: str, 
     data_profile: Optional[Dict[str, Any]] = None,
     level: str = "junior"
-) -> Optional[Dict[str, Any]]:
+) -> Optional[Mapping[str, Any]]:
     """
     Get rationale for why a test was chosen.
     
@@ -575,33 +665,16 @@ def get_test_rationale(
         level: Explanation depth
     
     Returns:
-        Dictionary with test info, rationale, assumptions, alternatives
+        Mapping with test info, rationale, assumptions, alternatives;
+        read-only unless assumption checks were added for data_profile
     """
-    if test_id not in TEST_KNOWLEDGE:
-        return None
-    
-    knowledge = TEST_KNOWLEDGE[test_id]
-    why = knowledge.get("why_it_works", {})
-    
-    result = {
-        "test_id": test_id,
-        "name": knowledge.get("name", test_id),
-        "name_ru": knowledge.get("name_ru", test_id),
-        "when_to_use": knowledge.get("when_to_use", []),
-        "why_it_works": why.get(level, why.get("junior", "")),
-        "assumptions": knowledge.get("assumptions", []),
-        "alternatives": knowledge.get("alternatives", {}),
-        "effect_size": knowledge.get("effect_size"),
-        "emoji": knowledge.get("emoji", "📊")
-    }
-    
-    # Add assumption checks if data_profile provided
-    if data_profile:
-        result["assumption_checks"] = _check_assumptions(
-            knowledge.get("assumptions", []),
-            data_profile
-        )
+    base = _test_rationale(test_id, level)
+    if base is None or not data_profile:
+        return base
     
+    # Assumption checks depend on the data, so they go on a fresh copy
+    result = dict(base)
+    result["assumption_checks"] = _check_assumptions(base["assumptions"], data_profile)
     return result
 
 
@@ -619,40 +692,18 @@ def get_effect_size_interpretation(
     Returns:
         Dictionary with interpretation, label, percentile info
     """
-    if "effect_size" not in STAT_TERMS:
+    effect_type = _EFFECT_TYPE_ALIASES.get(effect_type, effect_type)
+    compiled = _CLASSIFIERS.get(effect_type)
+    if compiled is None:
         return {"label": "unknown", "interpretation": ""}
     
-    thresholds = STAT_TERMS["effect_size"].get("thresholds", {})
-    
-    if effect_type == "eta_squared":
-        effect_type = "partial_eta_squared" if "partial_eta_squared" in thresholds else effect_type
-
-    if effect_type not in thresholds:
-        return {"label": "unknown", "interpretation": ""}
-    
-    type_thresholds = thresholds[effect_type]
     abs_value = abs(value)
-    
-    # Find the appropriate category
-    label = "unknown"
-    for category, bounds in type_thresholds.items():
-        max_val = bounds.get("max", float("inf"))
-        min_val = bounds.get("min", 0)
-        
-        if min_val <= abs_value <= max_val:
-            label = bounds.get("label", category)
-            break
-        elif "min" in bounds and abs_value >= min_val:
-            label = bounds.get("label", category)
-            break
+    label = _band_label(compiled, abs_value)
     
     # Practical meaning for Cohen's d
     practical = ""
     if effect_type == "cohens_d":
-        cohens_practical = STAT_TERMS.get("cohens_d", {}).get("practical_meaning", {})
-        closest = min(cohens_practical.keys(), key=lambda x: abs(x - abs_value), default=None)
-        if closest:
-            practical = cohens_practical[closest]
+        practical = practical_meaning_d(abs_value)
     
     return {
         "value": value,
@@ -661,10 +712,43 @@ def get_effect_size_interpretation(
         "label": label,
         "label_ru": label,  # Already in Russian from thresholds
         "practical_meaning": practical,
-        "direction": "positive" if value > 0 else "negative" if value < 0 else "none"
+        "direction": _SIGN_LABEL[int(value > 0) - int(value < 0) + 1]
     }
 
 
+# Power band -> (constant fields, message template or None if the message is constant)
+_POWER_RESPONSES: Dict[str, Tuple[Mapping[str, Any], Optional[str]]] = {
+    "low": (types.MappingProxyType({
+        "status": "critical",
+        "status_ru": "критически низкая",
+        "message": "Критически низкая мощность. Высокий риск пропустить реальный эффект.",
+        "recommendation": "Увеличьте размер выборки значительно.",
+        "icon": "🔴"
+    }), None),
+    "insufficient": (types.MappingProxyType({
+        "status": "insufficient",
+        "status_ru": "недостаточная",
+        "message": None,
+        "recommendation": "Рассмотрите увеличение выборки для более надёжных выводов.",
+        "icon": "🟡"
+    }), "Мощность {:.0%} ниже рекомендуемых 80%."),
+    "adequate": (types.MappingProxyType({
+        "status": "adequate",
+        "status_ru": "адекватная",
+        "message": None,
+        "recommendation": None,
+        "icon": "🟢"
+    }), "Мощность {:.0%} — адекватна для обнаружения эффекта."),
+    "high": (types.MappingProxyType({
+        "status": "high",
+        "status_ru": "высокая",
+        "message": None,
+        "recommendation": "Выборка может быть избыточной для данного effect size.",
+        "icon": "🟢"
+    }), "Мощность {:.0%} — высокая."),
+}
+
+
 def get_power_recommendation(power: float) -> Dict[str, Any]:
     """
     Get recommendation based on power value.
@@ -675,73 +759,53 @@ def get_power_recommendation(power: float) -> Dict[str, Any]:
     Returns:
         Dictionary with status, message, recommendation
     """
-    if power < 0.5:
-        return {
-            "status": "critical",
-            "status_ru": "критически низкая",
-            "message": "Критически низкая мощность. Высокий риск пропустить реальный эффект.",
-            "recommendation": "Увеличьте размер выборки значительно.",
-            "icon": "🔴"
-        }
-    elif power < 0.8:
-        return {
-            "status": "insufficient",
-            "status_ru": "недостаточная",
-            "message": f"Мощность {power:.0%} ниже рекомендуемых 80%.",
-            "recommendation": "Рассмотрите увеличение выборки для более надёжных выводов.",
-            "icon": "🟡"
-        }
-    elif power < 0.95:
-        return {
-            "status": "adequate",
-            "status_ru": "адекватная",
-            "message": f"Мощность {power:.0%} — адекватна для обнаружения эффекта.",
-            "recommendation": None,
-            "icon": "🟢"
-        }
-    else:
-        return {
-            "status": "high",
-            "status_ru": "высокая",
-            "message": f"Мощность {power:.0%} — высокая.",
-            "recommendation": "Выборка может быть избыточной для данного effect size.",
-            "icon": "🟢"
-        }
+    cuts, bands = _POWER_BANDS
+    static, message = _POWER_RESPONSES[bands[min(bisect.bisect_right(cuts, power), len(bands) - 1)]]
+    out = dict(static)
+    if message is not None:
+        out["message"] = message.format(power)
+    return out
+
+
+# Testable assumptions: data_profile key holding the test's p-value, and the test name
+_ASSUMPTION_PROBES: Dict[str, Tuple[str, str]] = {
+    "normality": ("shapiro_p", "Shapiro-Wilk test"),
+    "homogeneity": ("levene_p", "Levene's test"),
+}
+_ASSUMPTION_REMEDIES: Dict[str, str] = {
+    a: (STAT_TERMS[a].if_violated if a in STAT_TERMS else None) or "" for a in _ASSUMPTION_PROBES
+}
 
 
 def _check_assumptions(
-    assumptions: List[str], 
+    assumptions: Sequence[str], 
     data_profile: Dict[str, Any]
 ) -> List[Dict[str, Any]]:
     """Check assumptions against data profile."""
     results = []
+    # Loop-invariant globals bound to locals
+    probes, remedies, name_of = _ASSUMPTION_PROBES, _ASSUMPTION_REMEDIES, term_name
     
     for assumption in assumptions:
         check = {
             "assumption": assumption,
-            "term": STAT_TERMS.get(assumption, {}).get("term", assumption),
+            "term": name_of(assumption, "en"),
             "passed": None,
             "p_value": None,
             "note": ""
         }
         
-        if assumption == "normality":
-            shapiro_p = data_profile.get("shapiro_p")
-            if shapiro_p is not None:
-                check["passed"] = shapiro_p > 0.05
-                check["p_value"] = shapiro_p
-                check["note"] = "Shapiro-Wilk test"
-                if not check["passed"]:
-                    check["recommendation"] = STAT_TERMS.get("normality", {}).get("if_violated", "")
-        
-        elif assumption == "homogeneity":
-            levene_p = data_profile.get("levene_p")
-            if levene_p is not None:
-                check["passed"] = levene_p > 0.05
-                check["p_value"] = levene_p
-                check["note"] = "Levene's test"
-                if not check["passed"]:
-                    check["recommendation"] = STAT_TERMS.get("homogeneity", {}).get("if_violated", "")
+        probe = probes.get(assumption)
+        if probe is not None:
+            profile_key, note = probe
+            p = data_profile.get(profile_key)
+            if p is not None:
+                passed = p > 0.05
+                check["passed"] = passed
+                check["p_value"] = p
+                check["note"] = note
+                if not passed:
+                    check["recommendation"] = remedies[assumption]
         
         elif assumption == "independence":
             check["passed"] = data_profile.get("independence", True)
@@ -752,30 +816,35 @@ def _check_assumptions(
     return results
 
 
+# Catalogue listings are static: built once, handed out as fresh lists
+_ALL_TERMS: Tuple[Dict[str, str], ...] = tuple(
+    {
+        "key": key,
+        "term": term_name(key, "en"),
+        "term_ru": term_name(key, "ru"),
+        "emoji": val.emoji or "📊"
+    }
+    for key, val in STAT_TERMS.items()
+)
+_ALL_TESTS: Tuple[Dict[str, str], ...] = tuple(
+    {
+        "key": key,
+        "name": val.name or key,
+        "name_ru": val.name_ru or key,
+        "emoji": val.emoji or "📊"
+    }
+    for key, val in TEST_KNOWLEDGE.items()
+)
+
+
 def get_all_terms() -> List[Dict[str, str]]:
     """Get list of all available statistical terms."""
-    return [
-        {
-            "key": key,
-            "term": val.get("term", key),
-            "term_ru": val.get("term_ru", key),
-            "emoji": val.get("emoji", "📊")
-        }
-        for key, val in STAT_TERMS.items()
-    ]
+    return list(_ALL_TERMS)
 
 
 def get_all_tests() -> List[Dict[str, str]]:
     """Get list of all available statistical tests with info."""
-    return [
-        {
-            "key": key,
-            "name": val.get("name", key),
-            "name_ru": val.get("name_ru", key),
-            "emoji": val.get("emoji", "📊")
-        }
-        for key, val in TEST_KNOWLEDGE.items()
-    ]
+    return list(_ALL_TESTS)
 
 
 def get_citation(reference_key: str) -> Optional[Dict[str, str]]:
@@ -795,7 +864,7 @@ def get_citation(reference_key: str) -> Optional[Dict[str, str]]:
     return ACADEMIC_REFERENCES.get(reference_key)
 
 
-def get_all_references() -> Dict[str, Dict[str, str]]:
+def get_all_references() -> Mapping[str, Dict[str, str]]:
     """
     Get all academic references for methodology documentation.
     
@@ -805,11 +874,36 @@ def get_all_references() -> Dict[str, Dict[str, str]]:
     - Justifying methodological choices
     
     Returns:
-        Dictionary of all academic references
+        Read-only mapping of all academic references
     """
     return ACADEMIC_REFERENCES
 
 
+_TEST_TO_REFS = {
+    "t_test_ind": ("effect_size_conventions", "welch_default", "effect_size_primer"),
+    "welch_t_test": ("welch_default", "effect_size_conventions"),
+    "mann_whitney": ("mann_whitney", "effect_size_primer"),
+    "anova": ("effect_size_conventions", "bonferroni", "effect_size_primer"),
+    "kruskal_wallis": ("kruskal_wallis", "bonferroni"),
+    "chi_square": ("de_smith_handbook", "field_spss"),
+    "pearson": ("de_smith_handbook", "field_spss"),
+    "spearman": ("de_smith_handbook", "field_spss")
+}
+
+
+def _citations(ref_keys: Sequence[str]) -> Tuple[Dict[str, str], ...]:
+    return tuple(
+        {"key": key, **ACADEMIC_REFERENCES[key]}
+        for key in ref_keys
+        if key in ACADEMIC_REFERENCES
+    )
+
+
+# Resolved citation lists per test, built once
+_TEST_REFS = {test_id: _citations(keys) for test_id, keys in _TEST_TO_REFS.items()}
+_DEFAULT_TEST_REFS = _citations(("de_smith_handbook",))
+
+
 def get_references_for_test(test_id: str) -> List[Dict[str, str]]:
     """
     Get relevant references for a specific statistical test.
@@ -820,23 +914,72 @@ def get_references_for_test(test_id: str) -> List[Dict[str, str]]:
     Returns:
         List of relevant citations
     """
-    test_to_refs = {
-        "t_test_ind": ["effect_size_conventions", "welch_default", "effect_size_primer"],
-        "welch_t_test": ["welch_default", "effect_size_conventions"],
-        "mann_whitney": ["mann_whitney", "effect_size_primer"],
-        "anova": ["effect_size_conventions", "bonferroni", "effect_size_primer"],
-        "kruskal_wallis": ["kruskal_wallis", "bonferroni"],
-        "chi_square": ["de_smith_handbook", "field_spss"],
-        "pearson": ["de_smith_handbook", "field_spss"],
-        "spearman": ["de_smith_handbook", "field_spss"]
-    }
-    
-    ref_keys = test_to_refs.get(test_id, ["de_smith_handbook"])
-    return [
-        {"key": key, **ACADEMIC_REFERENCES[key]}
-        for key in ref_keys
-        if key in ACADEMIC_REFERENCES
-    ]
+    return list(_TEST_REFS.get(test_id, _DEFAULT_TEST_REFS))
+
+
+_REPORTING_TEMPLATES = {
+    "t_test_ind": "t({df}) = {stat:.2f}, p {p_str}, d = {effect:.2f} [{effect_label}]",
+    "welch_t_test": "t({df:.1f}) = {stat:.2f}, p {p_str}, d = {effect:.2f} [{effect_label}]",
+    "mann_whitney": "U = {stat:.0f}, p {p_str}, r = {effect:.2f}",
+    "anova": "F({df_between}, {df_within}) = {stat:.2f}, p {p_str}, η² = {effect:.3f} [{effect_label}]",
+    "kruskal_wallis": "H({df}) = {stat:.2f}, p {p_str}",
+    "chi_square": "χ²({df}) = {stat:.2f}, p {p_str}, V = {effect:.2f}",
+    "pearson": "r({df}) = {stat:.2f}, p {p_str}",
+    "spearman": "ρ({df}) = {stat:.2f}, p {p_str}"
+}
+
+
+def _report_p_str(result: Dict[str, Any]) -> str:
+    p = result.get("p_value", 1.0)
+    if p < 0.001:
+        return "< .001"
+    return f"= {p:.3f}".lstrip("0")
+
+
+def _report_effect_label(result: Dict[str, Any]) -> str:
+    effect_info = get_effect_size_interpretation(
+        result.get("effect_size_type", "cohens_d"), result.get("effect_size", 0)
+    )
+    return effect_info.get("label_ru", "")
+
+
+# Template placeholder -> how to compute it from a result dict
+_TEMPLATE_FIELDS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "stat": lambda r: r.get("stat_value", r.get("t", r.get("statistic", 0))),
+    "df": lambda r: r.get("df", r.get("dof", 0)),
+    "df_between": lambda r: r.get("df_between", 0),
+    "df_within": lambda r: r.get("df_within", 0),
+    "p_str": _report_p_str,
+    "effect": lambda r: abs(r.get("effect_size", 0)),
+    "effect_label": _report_effect_label,
+}
+
+
+def _compile_reporter(template: str) -> Callable[[Dict[str, Any]], str]:
+    """Formatter for one template that computes only the placeholders it uses."""
+    fields: Dict[str, bool] = {}
+    for _, name, spec, _ in Formatter().parse(template):
+        if name:
+            # A format spec such as ".2f" only accepts numbers
+            fields[name] = fields.get(name, False) or bool(spec)
+    getters = tuple((name, _TEMPLATE_FIELDS[name], numeric) for name, numeric in fields.items())
+    fmt = template.format
+
+    def report(result: Dict[str, Any]) -> str:
+        values = {}
+        for name, get, numeric in getters:
+            value = get(result)
+            if numeric and not isinstance(value, numbers.Number):
+                return ""
+            values[name] = value
+        return fmt(**values)
+
+    return report
+
+
+_COMPILED_REPORTERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    test_id: _compile_reporter(template) for test_id, template in _REPORTING_TEMPLATES.items()
+}
 
 
 def get_reporting_template(test_id: str, result: Dict[str, Any]) -> str:
@@ -854,45 +997,34 @@ def get_reporting_template(test_id: str, result: Dict[str, Any]) -> str:
         >>> get_reporting_template("t_test_ind", {"t": 2.45, "df": 48, "p_value": 0.018, "effect_size": 0.71})
         "t(48) = 2.45, p = .018, d = 0.71 [средний эффект]"
     """
-    templates = {
-        "t_test_ind": "t({df}) = {stat:.2f}, p {p_str}, d = {effect:.2f} [{effect_label}]",
-        "welch_t_test": "t({df:.1f}) = {stat:.2f}, p {p_str}, d = {effect:.2f} [{effect_label}]",
-        "mann_whitney": "U = {stat:.0f}, p {p_str}, r = {effect:.2f}",
-        "anova": "F({df_between}, {df_within}) = {stat:.2f}, p {p_str}, η² = {effect:.3f} [{effect_label}]",
-        "kruskal_wallis": "H({df}) = {stat:.2f}, p {p_str}",
-        "chi_square": "χ²({df}) = {stat:.2f}, p {p_str}, V = {effect:.2f}",
-        "pearson": "r({df}) = {stat:.2f}, p {p_str}",
-        "spearman": "ρ({df}) = {stat:.2f}, p {p_str}"
-    }
-    
-    if test_id not in templates:
+    reporter = _COMPILED_REPORTERS.get(test_id)
+    if reporter is None:
         return ""
+    return reporter(result)
+
+
+def get_reporting_templates(rows: Sequence[Dict[str, Any]]) -> List[str]:
+    """
+    Batch form of get_reporting_template for whole result tables.
     
-    # Format p-value
-    p = result.get("p_value", 1.0)
-    if p < 0.001:
-        p_str = "< .001"
-    else:
-        p_str = f"= {p:.3f}".lstrip("0")
-    
-    # Get effect size label
-    effect = result.get("effect_size", 0)
-    effect_type = result.get("effect_size_type", "cohens_d")
-    effect_info = get_effect_size_interpretation(effect_type, effect)
-    effect_label = effect_info.get("label_ru", "")
-    
-    try:
-        return templates[test_id].format(
-            stat=result.get("stat_value", result.get("t", result.get("statistic", 0))),
-            df=result.get("df", result.get("dof", 0)),
-            df_between=result.get("df_between", 0),
-            df_within=result.get("df_within", 0),
-            p_str=p_str,
-            effect=abs(effect),
-            effect_label=effect_label
-        )
-    except (KeyError, ValueError):
-        return ""
+    Args:
+        rows: Result dictionaries, each carrying its "test_id"
+    
+    Returns:
+        APA-formatted strings in the order of rows ("" for unknown tests)
+    """
+    out = [""] * len(rows)
+    by_test: Dict[Any, List[int]] = defaultdict(list)
+    for i, row in enumerate(rows):
+        by_test[row.get("test_id")].append(i)
+    
+    for test_id, indices in by_test.items():
+        reporter = _COMPILED_REPORTERS.get(test_id)
+        if reporter is None:
+            continue
+        for i in indices:
+            out[i] = reporter(rows[i])
+    return out
 
 
 # =============================================================================
@@ -900,35 +1032,35 @@ def get_reporting_template(test_id: str, result: Dict[str, Any]) -> str:
 # =============================================================================
 
 RECOMMENDED_READING = {
-    "effect_sizes": [
+    "effect_sizes": (
         "Cohen, J. (1988). Statistical Power Analysis — классика, обязательно для понимания d, r, f",
         "Lakens, D. (2013). Frontiers in Psychology — практический туториал с формулами",
         "Field, A. (2018). Discovering Statistics — доступное объяснение"
-    ],
-    "p_values": [
+    ),
+    "p_values": (
         "ASA Statement (Wasserstein & Lazar, 2016) — официальная позиция по p-value",
         "Greenland et al. (2016). European Journal of Epidemiology — 25 мифов о p-value"
-    ],
-    "power_analysis": [
+    ),
+    "power_analysis": (
         "G*Power manual (Faul et al., 2007) — методология расчёта мощности",
         "Cohen, J. (1992). Psychological Bulletin — 'A Power Primer'"
-    ],
-    "multiple_comparisons": [
+    ),
+    "multiple_comparisons": (
         "Benjamini & Hochberg (1995) — FDR коррекция",
         "Dunn (1961) — Bonferroni коррекция"
-    ],
-    "nonparametric": [
+    ),
+    "nonparametric": (
         "Mann & Whitney (1947) — оригинальная статья U-теста",
         "Kruskal & Wallis (1952) — H-тест для 3+ групп"
-    ],
-    "general_reference": [
+    ),
+    "general_reference": (
         "de Smith, M. J. (2018). statsref.com — онлайн справочник",
         "APA Publication Manual (7th ed.) — стандарты отчётности"
-    ]
+    )
 }
 
 
-def get_recommended_reading(topic: str = "general_reference") -> List[str]:
+def get_recommended_reading(topic: str = "general_reference") -> Tuple[str, ...]:
     """
     Get recommended reading list for a topic.
     
@@ -937,6 +1069,6 @@ def get_recommended_reading(topic: str = "general_reference") -> List[str]:
                "multiple_comparisons", "nonparametric", "general_reference"
     
     Returns:
-        List of recommended sources
+        Tuple of recommended sources (shared, read-only)
     """
     return RECOMMENDED_READING.get(topic, RECOMMENDED_READING["general_reference"])
@@ -0,0 +1,114 @@
+"""
+Russian-language explanation texts for ``stat_knowledge.STAT_TERMS``.
+
+Kept out of the main module so that numeric consumers (thresholds, formulas)
+do not pay for the verbose text blocks; loaded on first use of
+``stat_knowledge.STAT_TERMS_FULL`` or the definition lookups.
+"""
+
+from typing import Any, Dict
+
+
+DEFINITIONS: Dict[str, Dict[str, Any]] = {
+    "p_value": {
+        "definition": {
+            "junior": "Чем меньше p-value, тем сильнее доказательства против нулевой гипотезы. Обычно сравнивают с 0.05.",
+            "mid": "Вероятность получить статистику ≥ наблюдаемой при условии, что H0 верна. Зависит от размера выборки.",
+            "senior": "P(data|H0). Не путать с P(H0|data). При большом n даже trivial эффекты дают p < 0.05. Рассматривать вместе с effect size и CI."
+        },
+        "common_mistakes": (
+            "p-value ≠ вероятность что H0 верна",
+            "p < 0.05 ≠ практическая значимость",
+            "p > 0.05 ≠ 'эффекта нет' (может быть недостаток мощности)"
+        ),
+    },
+
+    "effect_size": {
+        "definition": {
+            "junior": "Насколько большой эффект мы нашли. Не зависит от размера выборки.",
+            "mid": "Стандартизированная мера силы эффекта. Cohen's d = разница средних / pooled SD.",
+            "senior": "Позволяет сравнивать результаты между исследованиями. Для метаанализа важнее p-value."
+        },
+        "common_mistakes": (
+            "Игнорирование effect size при significant p-value",
+            "Использование только p-value для выводов"
+        ),
+    },
+
+    "power": {
+        "definition": {
+            "junior": "Вероятность обнаружить эффект, если он реально существует. Рекомендуется ≥ 80%.",
+            "mid": "Power = 1 - β, где β — вероятность ошибки II рода (пропустить реальный эффект). Зависит от n, effect size, alpha.",
+            "senior": "При power = 0.8 и реальном эффекте — 20% шанс получить p > 0.05. Post-hoc power analysis имеет ограничения."
+        },
+    },
+
+    "alpha": {
+        "definition": {
+            "junior": "Порог для принятия решения. Обычно 0.05 (5%). Если p < alpha — результат значимый.",
+            "mid": "Вероятность ошибки I рода (ложноположительный результат). При alpha = 0.05 в 5% случаев отвергаем верную H0.",
+            "senior": "При множественных сравнениях нужна коррекция (Bonferroni, FDR). В некоторых областях используют alpha = 0.005."
+        },
+    },
+
+    "confidence_interval": {
+        "definition": {
+            "junior": "Диапазон, в котором с 95% уверенностью находится истинное значение параметра.",
+            "mid": "При повторении эксперимента 100 раз, ~95 CI из 100 захватят истинное значение.",
+            "senior": "CI для effect size важнее CI для mean. Если CI не включает 0 — эффект значим на данном alpha."
+        },
+    },
+
+    "normality": {
+        "definition": {
+            "junior": "Данные должны быть примерно нормально распределены для t-test и ANOVA.",
+            "mid": "Благодаря ЦПТ, при n > 30 распределение средних приближается к нормальному. Для малых n — проверяйте Shapiro-Wilk.",
+            "senior": "T-test устойчив к нарушениям нормальности при равных n и симметричных распределениях. Критичнее для малых выборок."
+        },
+    },
+
+    "homogeneity": {
+        "definition": {
+            "junior": "Дисперсии в сравниваемых группах должны быть примерно одинаковыми.",
+            "mid": "Levene's test проверяет равенство дисперсий. При нарушении — используйте Welch's correction.",
+            "senior": "ANOVA устойчив к нарушениям при равных n. При неравных n и гетероскедастичности — Welch ANOVA или Games-Howell post-hoc."
+        },
+    },
+
+    "independence": {
+        "definition": {
+            "junior": "Каждое наблюдение не должно зависеть от других.",
+            "mid": "Нарушается при repeated measures, кластерных данных, временных рядах.",
+            "senior": "Для зависимых данных — paired tests, mixed models, GEE. При сетевых эффектах — cluster-robust SE."
+        },
+    },
+
+    "cohens_d": {
+        "definition": {
+            "junior": "Разница между группами в единицах стандартного отклонения.",
+            "mid": "d = (M1 - M2) / SD_pooled. Интерпретация: 0.2 малый, 0.5 средний, 0.8 большой.",
+            "senior": "Hedges' g — коррекция для малых выборок. Glass's Δ — когда SD групп различаются существенно."
+        },
+    },
+
+    "eta_squared": {
+        "definition": {
+            "junior": "Доля дисперсии, объясняемая фактором. Аналог R² для ANOVA.",
+            "mid": "η² = SS_between / SS_total. Partial η² учитывает только relevant variance.",
+            "senior": "η² переоценивает effect в выборке. ω² — менее смещённая оценка для популяции."
+        },
+    },
+
+    "multiple_comparison": {
+        "definition": {
+            "junior": "Когда делаешь много тестов, шанс ложной находки растёт. Коррекция это исправляет.",
+            "mid": "При 20 тестах с α=0.05 ожидается 1 ложноположительный. FDR контролирует долю ложных среди значимых.",
+            "senior": "FWER vs FDR. Bonferroni: α/n, очень консервативен. BH: step-up, контролирует E[V/R]. BY: для зависимых тестов."
+        },
+        "common_mistakes": (
+            "Не корректировать при множественных сравнениях",
+            "Использовать Bonferroni когда BH достаточно",
+            "Путать FWER и FDR"
+        ),
+    },
+}
@@ -1,4 +1,193 @@
-from typing import Dict, Any
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+# "%" formatting of a single float is measurably faster than an f-string here
+_P_FMT = "p = %.3f"
+
+_ES_LABELS = ("negligible effect", "small effect", "medium effect", "large effect")
+# Same bands as the r family below, worded for a correlation coefficient
+_CORR_STRENGTH = ("negligible", "weak", "moderate", "strong")
+
+# Canonical effect-size families and their upper cuts; |es| < cuts[i] gets _ES_LABELS[i].
+_ES_ETA = "eta2"
+_ES_R = "r"
+_ES_D = "cohens_d"
+_ES_CUTS: Dict[str, Tuple[float, ...]] = {
+    _ES_ETA: (0.01, 0.06, 0.14),
+    _ES_R: (0.1, 0.3, 0.5),
+    _ES_D: (0.2, 0.5, 0.8),
+}
+_ES_ALIASES: Dict[str, str] = {
+    **dict.fromkeys(("eta2", "eta_sq", "eta_squared", "np2", "partial_eta2", "eps_sq", "epsilon_squared"), _ES_ETA),
+    **dict.fromkeys(("r", "pearson", "spearman", "rbc", "rank_biserial", "rank_biserial_correlation", "cramers_v", "cramer_v"), _ES_R),
+}
+
+
+@lru_cache(maxsize=64)
+def _normalize_eff_name(name: str) -> str:
+    """Effect-size name -> family (_ES_ETA, _ES_R or _ES_D); names come from a small set."""
+    key = name.lower().replace("-", "_").replace(" ", "_")
+    return _ES_ALIASES.get(key, _ES_D)
+
+
+# How the "pro" group-comparison text prints an effect size, keyed by the
+# space-stripped, lower-cased name.  This is narrower than _ES_ALIASES on purpose:
+# names outside it (e.g. "pearson") are still classified by family but print as d.
+_EFF_NAME_KIND: Dict[str, str] = {
+    **dict.fromkeys(("eta2", "np2", "eps-sq", "eps_sq", "eta_squared", "partial_eta2"), "eta"),
+    **dict.fromkeys(("rbc", "r"), "r"),
+}
+_EFF_TEXT_FMT: Dict[str, str] = {
+    "eta": ", effect size = %.3f (%s)",
+    "r": ", effect size = %.2f (%s)",
+    "d": ", Cohen's d = %.2f (%s)",
+}
+
+
+@lru_cache(maxsize=64)
+def _eff_text_fmt(name: str) -> str:
+    """Effect-size name -> "%"-format for the value and its label."""
+    return _EFF_TEXT_FMT[_EFF_NAME_KIND.get(name.lower().replace(" ", ""), "d")]
+
+
+# Direction wording indexed by int(value > reference); a zero r reads as negative
+_CORR_DIRECTION = (("negative", "decrease"), ("positive", "increase"))
+_ONE_SAMPLE_DIRECTION = ("significantly lower", "significantly higher")
+
+
+class GCData(NamedTuple):
+    """Everything the group-comparison renderers need, read from results once."""
+    p_text: str
+    target: str
+    group_col: str
+    method_name: str
+    significant: bool
+    two_groups: bool  # significant with exactly two groups: means are reported
+    g1: Any
+    g2: Any
+    m1: float
+    m2: float
+    eff_size: Any
+    eff_interp: Any
+    eff_name: Optional[str]
+
+
+def _extract_gc_data(results: Dict[str, Any], variables: Dict[str, str]) -> GCData:
+    get = results.get
+    p = results['p_value']
+    significant = results['significant']
+    groups = get('groups', [])
+
+    # Method Name Resolution
+    method_obj = get("method")
+    if hasattr(method_obj, "name"):
+        method_name = method_obj.name
+    elif isinstance(method_obj, dict):
+        method_name = method_obj.get("name", "test")
+    else:
+        method_name = str(method_obj).replace("_", " ")
+
+    # Group means are only reported for significant two-group results
+    two_groups = significant and len(groups) == 2
+    g1 = g2 = None
+    m1 = m2 = 0
+    if two_groups:
+        plot_stats = get('plot_stats') or {}
+        g1, g2 = groups[0], groups[1]
+        s1 = plot_stats.get(g1)
+        s2 = plot_stats.get(g2)
+        m1 = s1.get('mean', 0) if s1 else 0
+        m2 = s2.get('mean', 0) if s2 else 0
+
+    return GCData(
+        p_text="p < 0.001" if p < 0.001 else _P_FMT % p,  # inlined format_p_value
+        target=variables.get('target', 'the variable'),
+        group_col=variables.get('group', 'group'),
+        method_name=method_name,
+        significant=significant,
+        two_groups=two_groups,
+        g1=g1, g2=g2, m1=m1, m2=m2,
+        eff_size=get('effect_size'),
+        eff_interp=get('effect_size_interpretation'),
+        eff_name=get('effect_size_name'),
+    )
+
+
+def _render_gc_simple(gc: GCData) -> str:
+    if not gc.significant:
+        return "No clear difference was found between the groups. They appear to be similar."
+
+    # Determine winner
+    if gc.two_groups:
+        winner, loser = (gc.g1, gc.g2) if gc.m1 > gc.m2 else (gc.g2, gc.g1)
+        return f"A significant difference was found. {winner} showed higher values than {loser}."
+    return "A significant difference was found between the groups."
+
+
+def _render_gc_ru(gc: GCData) -> str:
+    eff_text = ""
+    eff_interp, eff_size = gc.eff_interp, gc.eff_size
+    if isinstance(eff_interp, dict):
+        desc = eff_interp.get("description_ru") or eff_interp.get("label_ru")
+        if desc:
+            eff_text = f"; эффект: {desc}"
+    elif eff_size is not None:
+        try:
+            eff_text = f"; эффект: {float(eff_size):.2f}"
+        except Exception:
+            eff_text = ""
+
+    parts = [f"Проведен {gc.method_name} для оценки различий {gc.target} между группами ({gc.group_col}). "]
+
+    if not gc.significant:
+        parts.append(f"Статистически значимых различий не выявлено ({gc.p_text}{eff_text}).")
+        return "".join(parts)
+
+    parts.append(f"Обнаружены статистически значимые различия ({gc.p_text}{eff_text}). ")
+
+    if gc.two_groups:
+        direction = "выше" if gc.m1 > gc.m2 else "ниже"
+        parts.append(f"В частности, в группе {gc.g1} среднее значение {gc.target} (M = {gc.m1:.2f}) было {direction}, чем в группе {gc.g2} (M = {gc.m2:.2f}).")
+    return "".join(parts)
+
+
+def _render_gc_pro(gc: GCData) -> str:
+    eff_text = ""
+    eff_interp, eff_size, eff_name = gc.eff_interp, gc.eff_size, gc.eff_name
+    if isinstance(eff_interp, dict):
+        desc = eff_interp.get("description") or eff_interp.get("label")
+        if desc:
+            eff_text = f", {desc}"
+    elif eff_size is not None:
+        value = float(eff_size)
+        kind = _normalize_eff_name(str(eff_name or "cohen-d"))
+        eff_desc = _ES_LABELS[bisect_right(_ES_CUTS[kind], abs(value))]
+        eff_text = _eff_text_fmt(eff_name or "") % (value, eff_desc)
+
+    parts = [f"An independent {gc.method_name} was conducted to determine if there were differences in {gc.target} between groups defined by {gc.group_col}. "]
+
+    if not gc.significant:
+        parts.append(f"The analysis revealed no statistically significant difference between the groups ({gc.p_text}{eff_text}). ")
+        return "".join(parts)
+
+    # Significant
+    parts.append(f"There was a statistically significant difference between the groups ({gc.p_text}{eff_text}). ")
+
+    if gc.two_groups:
+        direction = "higher" if gc.m1 > gc.m2 else "lower"
+        parts.append(f"Specifically, the {gc.target} in the {gc.g1} group (M = {gc.m1:.2f}) was significantly {direction} than in the {gc.g2} group (M = {gc.m2:.2f}). ")
+
+    return "".join(parts)
+
+
+# Any style other than "simple" / "ru" renders the "pro" text
+_GC_RENDERERS: Dict[str, Callable[[GCData], str]] = {
+    "pro": _render_gc_pro,
+    "ru": _render_gc_ru,
+    "simple": _render_gc_simple,
+}
+
 
 class TextGenerator:
     """
@@ -8,43 +197,19 @@ class TextGenerator:
     
     @staticmethod
     def format_p_value(p: float) -> str:
-        if p < 0.001:
-            return "p < 0.001"
-        return f"p = {p:.3f}"
+        return "p < 0.001" if p < 0.001 else _P_FMT % p
 
     @staticmethod
     def interpret_effect_size(effect_size: float, effect_size_name: str = "cohen-d") -> str:
         if effect_size is None:
             return ""
 
-        name = str(effect_size_name or "").lower().replace("-", "_").replace(" ", "_")
-        abs_es = abs(float(effect_size))
-
-        if name in ["eta2", "eta_sq", "eta_squared", "np2", "partial_eta2", "eps_sq", "epsilon_squared"]:
-            if abs_es < 0.01:
-                return "negligible effect"
-            if abs_es < 0.06:
-                return "small effect"
-            if abs_es < 0.14:
-                return "medium effect"
-            return "large effect"
-
-        if name in ["r", "pearson", "spearman", "rbc", "rank_biserial", "rank_biserial_correlation", "cramers_v", "cramer_v"]:
-            if abs_es < 0.1:
-                return "negligible effect"
-            if abs_es < 0.3:
-                return "small effect"
-            if abs_es < 0.5:
-                return "medium effect"
-            return "large effect"
-
-        if abs_es < 0.2:
-            return "negligible effect"
-        if abs_es < 0.5:
-            return "small effect"
-        if abs_es < 0.8:
-            return "medium effect"
-        return "large effect"
+        kind = _normalize_eff_name(str(effect_size_name or ""))
+        return _ES_LABELS[bisect_right(_ES_CUTS[kind], abs(float(effect_size)))]
+
+    @staticmethod
+    def interpret_correlation_strength(r: float) -> str:
+        return _CORR_STRENGTH[bisect_right(_ES_CUTS[_ES_R], abs(float(r)))]
 
     @staticmethod
     def interpret_result(results: Dict[str, Any], variables: Dict[str, str], style: str = "pro") -> str:
@@ -61,179 +226,94 @@ class TextGenerator:
         else:
             method_id = str(method_obj)
             
-        # 1. Group Comparisons (Independent/Paired)
-        if method_id in ["t_test_ind", "t_test_welch", "t_test_rel", "mann_whitney", "wilcoxon"]:
-            return TextGenerator._interpret_group_comparison(results, variables, style)
-            
-        # 1.5 One-Sample
-        elif method_id == "t_test_one":
-            return TextGenerator._interpret_one_sample(results, variables) # Add style support later if needed
-            
-        # 2. Correlations
-        elif method_id in ["pearson", "spearman"]:
-            return TextGenerator._interpret_correlation(results, variables)
-
-        # 3. Categorical (Chi-Square)
-        elif method_id == "chi_square":
-             return TextGenerator._interpret_chi_square(results, variables)
-             
-        return "Analysis completed."
+        interpret = _CONCLUSION_DISPATCH.get(method_id)
+        if interpret is None:
+            return "Analysis completed."
+        return interpret(results, variables, style)
 
     @staticmethod
     def _interpret_group_comparison(results: Dict[str, Any], variables: Dict[str, str], style: str = "pro") -> str:
-        p_text = TextGenerator.format_p_value(results['p_value'])
-        target = variables.get('target', 'the variable')
-        group_col = variables.get('group', 'group')
-        groups = results.get('groups', [])
-        plot_stats = results.get('plot_stats', {})
-        eff_size = results.get('effect_size')
-        eff_interp = results.get('effect_size_interpretation') if isinstance(results, dict) else None
-        eff_name = results.get('effect_size_name')
-        
-        # Method Name Resolution
-        method_obj = results.get("method")
-        if hasattr(method_obj, "name"):
-            method_name = method_obj.name
-        elif isinstance(method_obj, dict):
-            method_name = method_obj.get("name", "test")
-        else:
-            method_name = str(method_obj).replace("_", " ")
-        
-        # Simple Style
-        if style == "simple":
-            if not results['significant']:
-                return "No clear difference was found between the groups. They appear to be similar."
-            
-            # Determine winner
-            if len(groups) == 2:
-                 g1, g2 = groups[0], groups[1]
-                 m1 = plot_stats.get(g1, {}).get('mean', 0)
-                 m2 = plot_stats.get(g2, {}).get('mean', 0)
-                 winner, loser = (g1, g2) if m1 > m2 else (g2, g1)
-                 return f"A significant difference was found. {winner} showed higher values than {loser}."
-            return "A significant difference was found between the groups."
-
-        if style == "ru":
-            eff_text = ""
-            if isinstance(eff_interp, dict):
-                desc = eff_interp.get("description_ru") or eff_interp.get("label_ru")
-                if desc:
-                    eff_text = f"; эффект: {desc}"
-            elif eff_size is not None:
-                try:
-                    eff_text = f"; эффект: {float(eff_size):.2f}"
-                except Exception:
-                    eff_text = ""
-
-            text = f"Проведен {method_name} для оценки различий {target} между группами ({group_col}). "
-
-            if not results['significant']:
-                text += f"Статистически значимых различий не выявлено ({p_text}{eff_text})."
-                return text
-
-            text += f"Обнаружены статистически значимые различия ({p_text}{eff_text}). "
-
-            if len(groups) == 2:
-                g1, g2 = groups[0], groups[1]
-                m1 = plot_stats.get(g1, {}).get('mean', 0)
-                m2 = plot_stats.get(g2, {}).get('mean', 0)
-                direction = "выше" if m1 > m2 else "ниже"
-                text += f"В частности, в группе {g1} среднее значение {target} (M = {m1:.2f}) было {direction}, чем в группе {g2} (M = {m2:.2f})."
-            return text
-
-        # Pro Style
-        eff_text = ""
-        if isinstance(eff_interp, dict):
-            desc = eff_interp.get("description") or eff_interp.get("label")
-            if desc:
-                eff_text = f", {desc}"
-        elif eff_size is not None:
-            eff_desc = TextGenerator.interpret_effect_size(eff_size, eff_name or "cohen-d")
-            if (eff_name or "").lower().replace(" ", "") in ["eta2", "np2", "eps-sq", "eps_sq", "eta_squared", "partial_eta2"]:
-                eff_text = f", effect size = {float(eff_size):.3f} ({eff_desc})"
-            elif (eff_name or "").lower().replace(" ", "") in ["rbc", "r"]:
-                eff_text = f", effect size = {float(eff_size):.2f} ({eff_desc})"
-            else:
-                eff_text = f", Cohen's d = {float(eff_size):.2f} ({eff_desc})"
-            
-        text = f"An independent {method_name} was conducted to determine if there were differences in {target} between groups defined by {group_col}. "
-        
-        if not results['significant']:
-            text += f"The analysis revealed no statistically significant difference between the groups ({p_text}{eff_text}). "
-            return text
-            
-        # Significant
-        text += f"There was a statistically significant difference between the groups ({p_text}{eff_text}). "
-        
-        if len(groups) == 2:
-             g1, g2 = groups[0], groups[1]
-             m1 = plot_stats.get(g1, {}).get('mean', 0)
-             m2 = plot_stats.get(g2, {}).get('mean', 0)
-             direction = "higher" if m1 > m2 else "lower"
-             text += f"Specifically, the {target} in the {g1} group (M = {m1:.2f}) was significantly {direction} than in the {g2} group (M = {m2:.2f}). "
-             
-        return text
+        gc = _extract_gc_data(results, variables)
+        return _GC_RENDERERS.get(style, _render_gc_pro)(gc)
 
     @staticmethod
     def _interpret_one_sample(results: Dict[str, Any], variables: Dict[str, str]) -> str:
-        p_text = TextGenerator.format_p_value(results['p_value'])
+        get = results.get
+        p = results['p_value']
+        p_text = "p < 0.001" if p < 0.001 else _P_FMT % p  # inlined format_p_value
         target = variables.get('target', 'the variable')
-        test_val = results.get('extra', {}).get('test_value', 0)
+        extra = get('extra')
+        test_val = extra.get('test_value', 0) if extra else 0
         
-        plot_stats = results.get('plot_stats', {})
-        stats = plot_stats.get("group", {})
-        mean = stats.get("mean", 0)
+        plot_stats = get('plot_stats')
+        stats = plot_stats.get("group") if plot_stats else None
+        mean = stats.get("mean", 0) if stats else 0
         
-        text = f"A one-sample t-test was conducted to determine if the mean of {target} differs significantly from {test_val}. "
+        parts = [f"A one-sample t-test was conducted to determine if the mean of {target} differs significantly from {test_val}. "]
         
         if not results['significant']:
-            text += f"No statistically significant difference was found (M = {mean:.2f}, {p_text}). The mean is statistically indistinguishable from {test_val}."
+            parts.append(f"No statistically significant difference was found (M = {mean:.2f}, {p_text}). The mean is statistically indistinguishable from {test_val}.")
         else:
-            direction = "significantly higher" if mean > test_val else "significantly lower"
-            text += f"The mean of {target} (M = {mean:.2f}) was {direction} than the test value of {test_val} ({p_text})."
+            direction = _ONE_SAMPLE_DIRECTION[int(mean > test_val)]
+            parts.append(f"The mean of {target} (M = {mean:.2f}) was {direction} than the test value of {test_val} ({p_text}).")
             
-        return text
+        return "".join(parts)
 
     @staticmethod
     def _interpret_correlation(results: Dict[str, Any], variables: Dict[str, str]) -> str:
-        p_text = TextGenerator.format_p_value(results['p_value'])
+        get = results.get
+        p = results['p_value']
+        p_text = "p < 0.001" if p < 0.001 else _P_FMT % p  # inlined format_p_value
+        significant = results['significant']
         var1 = variables.get('target', 'Variable 1')
         var2 = variables.get('predictor', 'Variable 2')
-        r_val = 0
         
         # Extract R from regression block if Pearson, or root of stat_value for others (approx)
         # Actually engine.py returns 'stat_value' as the correlation coefficient for pearson/spearman
-        r_val = results.get('stat_value', 0)
+        r_val = get('stat_value', 0)
         
         strength = TextGenerator.interpret_correlation_strength(r_val)
-        direction = "positive" if r_val > 0 else "negative"
+        direction, trend = _CORR_DIRECTION[int(r_val > 0)]
         
-        text = f"A {results.get('method')} analysis was performed to assess the relationship between {var1} and {var2}. "
+        parts = [f"A {get('method')} analysis was performed to assess the relationship between {var1} and {var2}. "]
         
-        if not results['significant']:
-             text += f"The relationship was not statistically significant ({p_text}). There is insufficient evidence to conclude that these variables are associated."
-             return text
+        if not significant:
+             parts.append(f"The relationship was not statistically significant ({p_text}). There is insufficient evidence to conclude that these variables are associated.")
+             return "".join(parts)
              
-        text += f"There was a statistically significant, {strength} {direction} correlation between {var1} and {var2} (r = {r_val:.2f}, {p_text}). "
-        
-        if direction == "positive":
-            text += f"This indicates that as {var2} increases, {var1} tends to increase."
-        else:
-            text += f"This indicates that as {var2} increases, {var1} tends to decrease."
-            
-        return text
+        parts.append(f"There was a statistically significant, {strength} {direction} correlation between {var1} and {var2} (r = {r_val:.2f}, {p_text}). ")
+        parts.append(f"This indicates that as {var2} increases, {var1} tends to {trend}.")
+        return "".join(parts)
 
     @staticmethod
     def _interpret_chi_square(results: Dict[str, Any], variables: Dict[str, str]) -> str:
-        p_text = TextGenerator.format_p_value(results['p_value'])
+        p = results['p_value']
+        p_text = "p < 0.001" if p < 0.001 else _P_FMT % p  # inlined format_p_value
         var1 = variables.get('target', 'Variable 1')
         var2 = variables.get('group', 'Variable 2')
         
-        text = f"A Chi-Square test of independence was performed to examine the relation between {var1} and {var2}. "
+        parts = [f"A Chi-Square test of independence was performed to examine the relation between {var1} and {var2}. "]
         
         if results['significant']:
-            text += f"The relation between these variables was significant ({p_text}). This suggests that {var1} is dependent on {var2}."
+            parts.append(f"The relation between these variables was significant ({p_text}). This suggests that {var1} is dependent on {var2}.")
         else:
-            text += f"The relation between these variables was not significant ({p_text}). {var1} appears to be independent of {var2}."
+            parts.append(f"The relation between these variables was not significant ({p_text}). {var1} appears to be independent of {var2}.")
             
-        return text
+        return "".join(parts)
+
+
+# method id -> interpreter(results, variables, style)
+_CONCLUSION_DISPATCH: Dict[str, Callable[[Dict[str, Any], Dict[str, str], str], str]] = {
+    # 1. Group Comparisons (Independent/Paired)
+    **dict.fromkeys(
+        ("t_test_ind", "t_test_welch", "t_test_rel", "mann_whitney", "wilcoxon"),
+        TextGenerator._interpret_group_comparison,
+    ),
+    # 1.5 One-Sample (no style support yet)
+    "t_test_one": lambda results, variables, style: TextGenerator._interpret_one_sample(results, variables),
+    # 2. Correlations
+    "pearson": lambda results, variables, style: TextGenerator._interpret_correlation(results, variables),
+    "spearman": lambda results, variables, style: TextGenerator._interpret_correlation(results, variables),
+    # 3. Categorical (Chi-Square)
+    "chi_square": lambda results, variables, style: TextGenerator._interpret_chi_square(results, variables),
+}
@@ -1,7 +1,92 @@
-from typing import Any, Dict, List
+import math
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 from scipy import stats
+from scipy.special import ndtr, ndtri
+
+# Royston (1995), AS R94 polynomial coefficients
+_SW_C1 = (0.0, 0.221157, -0.147981, -2.071190, 4.434685, -2.706056)
+_SW_C2 = (0.0, 0.042981, -0.293762, -1.752461, 5.682633, -3.582633)
+_SW_C3 = (0.5440, -0.39978, 0.025054, -6.714e-4)
+_SW_C4 = (1.3822, -0.77857, 0.062767, -0.0020322)
+_SW_C5 = (-1.5861, -0.31082, -0.083751, 0.0038915)
+_SW_C6 = (-0.4803, -0.082676, 0.0030302)
+_SW_G = (-2.273, 0.459)
+
+
+def _poly(coeffs, x: float) -> float:
+    result = 0.0
+    for c in reversed(coeffs):
+        result = result * x + c
+    return result
+
+
+@lru_cache(maxsize=64)
+def _shapiro_coefficients(n: int) -> np.ndarray:
+    """
+    Shapiro-Wilk a_i weights for the lower half of a sample of size n (AS R94).
+    Memoized: many columns of a dataset share the same length.
+    """
+    if n == 3:
+        return np.array([math.sqrt(0.5)])
+    half = n // 2
+    m = ndtri((np.arange(1, half + 1) - 0.375) / (n + 0.25))
+    summ2 = 2.0 * float(np.sum(m * m))
+    ssumm2 = math.sqrt(summ2)
+    rsn = 1.0 / math.sqrt(n)
+
+    a = np.empty(half)
+    a[0] = -m[0] / ssumm2 + _poly(_SW_C1, rsn)
+    if n > 5:
+        a[1] = -m[1] / ssumm2 + _poly(_SW_C2, rsn)
+        fac = math.sqrt((summ2 - 2.0 * m[0] ** 2 - 2.0 * m[1] ** 2)
+                        / (1.0 - 2.0 * a[0] ** 2 - 2.0 * a[1] ** 2))
+        a[2:] = -m[2:] / fac
+    else:
+        fac = math.sqrt((summ2 - 2.0 * m[0] ** 2) / (1.0 - 2.0 * a[0] ** 2))
+        a[1:] = -m[1:] / fac
+    a.setflags(write=False)
+    return a
+
+
+def shapiro_sorted(x_sorted: np.ndarray) -> Tuple[float, float]:
+    """
+    Shapiro-Wilk (W, p) for an already sorted, finite sample with 3 <= n <= 5000.
+    Same algorithm as scipy.stats.shapiro, minus the sort and with cached weights.
+    """
+    n = len(x_sorted)
+    a = _shapiro_coefficients(n)
+    half = len(a)
+
+    # Scale by the range first, as swilk does, for numerical stability
+    rng = x_sorted[-1] - x_sorted[0]
+    if rng <= 0:
+        return 1.0, 1.0
+    x = x_sorted / rng
+    numer = float(np.dot(a, x[::-1][:half] - x[:half])) ** 2
+    ssd = float(np.sum((x - x.mean()) ** 2))
+    w = min(numer / ssd, 1.0)
+
+    if n == 3:
+        pi6 = 6.0 / math.pi
+        return w, max(0.0, pi6 * (math.asin(math.sqrt(w)) - math.pi / 3.0))
+
+    w1 = math.log(1.0 - w) if w < 1.0 else -math.inf
+    if n <= 11:
+        gamma = _poly(_SW_G, n)
+        if w1 >= gamma:
+            return w, 1e-99
+        y = -math.log(gamma - w1)
+        mean = _poly(_SW_C3, n)
+        sd = math.exp(_poly(_SW_C4, n))
+    else:
+        y = w1
+        xx = math.log(n)
+        mean = _poly(_SW_C5, xx)
+        sd = math.exp(_poly(_SW_C6, xx))
+    return w, float(ndtr(-(y - mean) / sd))
 
 
 def check_normality(data, alpha: float = 0.05) -> Dict[str, Any]:
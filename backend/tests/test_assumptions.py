@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
+from scipy import stats
 from app.stats.engine import run_analysis
+from app.stats.assumptions import shapiro_sorted
 
 def test_assumptions_logic():
     print("--- 1. Testing Perfect Data (Parametric) ---")
@@ -49,5 +51,15 @@ def test_assumptions_logic():
     assert not has_homo_warn, "Welch test should not warn about homogeneity"
     assert res_welch.get("method_used") in (None, "t_test_welch", "mann_whitney")
 
+def test_shapiro_sorted_matches_scipy():
+    rng = np.random.default_rng(7)
+    for n in (3, 4, 7, 11, 12, 50, 500, 5000):
+        for x in (rng.normal(size=n), rng.exponential(size=n)):
+            w, p = shapiro_sorted(np.sort(x))
+            w_ref, p_ref = stats.shapiro(x)
+            assert abs(w - w_ref) < 1e-5, f"W mismatch at n={n}"
+            assert abs(p - p_ref) < 1e-5, f"p mismatch at n={n}"
+
 if __name__ == "__main__":
     test_assumptions_logic()
+    test_shapiro_sorted_matches_scipy()
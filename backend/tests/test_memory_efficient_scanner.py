@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from app.modules.memory_efficient_scanner import MemoryEfficientScanner
+
+
+def _mixed_frame(n):
+    rng = np.random.default_rng(3)
+    return pd.DataFrame({
+        "id": np.arange(n),
+        "value": rng.normal(size=n),
+        "group": rng.choice(["control", "treatment", "placebo arm"], n),
+        "note": [f"visit note {i} " * int(k) for i, k in enumerate(rng.integers(1, 4, n))],
+    })
+
+
+def test_estimate_memory_usage_close_to_deep_usage():
+    df = _mixed_frame(20_000)
+    estimate = MemoryEfficientScanner()._estimate_memory_usage(df)
+    actual = df.memory_usage(deep=True).sum()
+
+    assert abs(estimate - actual) / actual < 0.05
+
+
+def test_estimate_memory_usage_frame_smaller_than_sample():
+    df = _mixed_frame(50)
+    scanner = MemoryEfficientScanner()
+
+    assert abs(scanner._estimate_memory_usage(df, sample_rows=1000) - df.memory_usage(deep=True).sum()) <= 1
+    numeric = df[["id", "value"]]
+    assert scanner._estimate_memory_usage(numeric) == numeric.memory_usage(deep=True).sum()
+    assert scanner._estimate_memory_usage(df.iloc[:0]) == df.iloc[:0].memory_usage(deep=True).sum()
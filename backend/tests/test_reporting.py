@@ -0,0 +1,199 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import zipfile
+from concurrent.futures.process import BrokenProcessPool
+
+import matplotlib
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from PIL import Image
+
+from app.modules import plot_config, reporting
+
+
+@pytest.fixture
+def default_rc(monkeypatch):
+    # Match a freshly started worker: stock rcParams, publication config not yet applied
+    with matplotlib.rc_context():
+        matplotlib.rcdefaults()
+        monkeypatch.setattr(plot_config, "_APPLIED", False)
+        yield
+
+
+def _plot_jobs():
+    """Plots without random jitter/bootstrap, so renders are byte-for-byte repeatable."""
+    roc = {"plot_data": [{"x": x, "y": min(1.0, 1.5 * x)} for x in (0, 0.1, 0.2, 0.4, 0.7, 1)],
+           "plot_config": {"type": "line"}}
+    km = {"plot_data": [{"group": g, "time": t, "probability": p * scale}
+                        for g, scale in (("A", 1.0), ("B", 0.8))
+                        for t, p in zip(range(5), (1.0, 0.9, 0.75, 0.6, 0.5))]}
+    bars = {"plot_stats": {"A": {"mean": 2.0, "sem": 0.3}, "B": {"mean": 2.6, "sem": 0.2}}}
+    return [roc, km, bars, {}, {**roc, "plot_config": {"type": "line", "title": "again"}}]
+
+
+def test_plot_job_keeps_only_rendered_keys():
+    res = {"plot_data": [{"x": 1, "y": 2}], "post_hoc": [], "data": list(range(1000)), "conclusion": "c"}
+    assert reporting._plot_job(res) == {"plot_data": [{"x": 1, "y": 2}], "post_hoc": []}
+
+
+def test_plot_pool_matches_serial_order_and_bytes(monkeypatch, default_rc):
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    jobs = _plot_jobs()
+    serial = [reporting._render_docx_plot_png(job) for job in jobs]
+    assert all(serial)
+
+    try:
+        assert reporting._plot_pool() is None  # the first call only starts the workers
+        for warmup in reporting._PLOT_POOL_WARMUP:
+            warmup.result(timeout=300)
+        pool = reporting._plot_pool()
+        assert pool is not None
+
+        mapped = []
+        pool_map = pool.map
+        monkeypatch.setattr(pool, "map", lambda fn, it: mapped.append(fn) or pool_map(fn, it))
+        assert reporting._render_plots_png_bytes(jobs) == serial
+        assert mapped == [reporting._render_docx_plot_png]
+    finally:
+        reporting.shutdown_plot_pool()
+    assert reporting._PLOT_POOL is None
+
+
+def test_broken_plot_pool_is_discarded_and_rendered_serially(monkeypatch, default_rc):
+    class BrokenPool:
+        shut_down = False
+
+        def map(self, fn, jobs):
+            raise BrokenProcessPool("worker died")
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            self.shut_down = True
+
+    broken = BrokenPool()
+    monkeypatch.setattr(reporting, "_PLOT_POOL", broken)
+    monkeypatch.setattr(reporting, "_PLOT_POOL_WARMUP", [])
+    jobs = _plot_jobs()
+
+    assert reporting._render_plots_png_bytes(jobs) == [reporting._render_docx_plot_png(job) for job in jobs]
+    assert broken.shut_down
+    assert reporting._PLOT_POOL is None
+
+
+def test_non_numeric_plot_values_are_coerced_not_fatal():
+    rows = [{"group": g, "value": v} for g, v in zip("ABAB" * 3, [1.0, "x", None, 4.0] * 3)]
+    values = reporting._plot_columns(rows, "value", numeric=True)["value"]
+
+    assert values.dtype == float
+    assert np.isnan(values[1]) and np.isnan(values[2]) and values[3] == 4.0
+    assert reporting._render_plot_png_bytes({"plot_data": rows}).startswith(b"\x89PNG")
+
+
+def _spy_axes(monkeypatch, name):
+    calls = []
+    original = getattr(Axes, name)
+
+    def spy(self, *args, **kwargs):
+        calls.append((args, kwargs))
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Axes, name, spy)
+    return calls
+
+
+def test_km_missing_groups_share_one_curve(monkeypatch):
+    steps = _spy_axes(monkeypatch, "step")
+    rows = [{"group": g, "time": t, "probability": 1 - t / 10} for g in ("A", "B") for t in range(4)]
+    rows += [{"group": float("nan"), "time": 1, "probability": 0.5} for _ in range(3)]
+    rows += [{"group": None, "time": 2, "probability": 0.4}, {"group": np.nan, "time": 3, "probability": 0.3}]
+
+    assert reporting._render_plot_png_bytes({"plot_data": rows})
+    assert [kwargs["label"] for _, kwargs in steps] == ["Group A", "Group B", "Group None"]
+    assert len(steps[-1][0][0]) == 0
+
+
+def test_roc_order_with_tied_x_matches_sort_values(monkeypatch):
+    lines = _spy_axes(monkeypatch, "plot")
+    xs = [0.5, 0.1, 0.5, 0.0, 0.1, 1.0, 0.5, np.nan, 0.1, 0.9]
+    rows = [{"x": x, "y": i / 10} for i, x in enumerate(xs)]
+    expected = pd.DataFrame(rows).sort_values("x")
+
+    assert reporting._render_plot_png_bytes({"plot_data": rows, "plot_config": {"type": "line"}})
+    (x, y), _ = lines[0]
+    np.testing.assert_array_equal(x, expected["x"].to_numpy())
+    np.testing.assert_array_equal(y, expected["y"].to_numpy())
+
+
+def test_docx_embeds_palette_png_at_docx_dpi():
+    run = {"protocol_name": "P", "results": {"s1": {"method": "t_test_ind", "plot_stats": _plot_jobs()[2]["plot_stats"]}}}
+    docx_bytes = reporting.generate_protocol_docx_report(run, "DS")
+
+    with zipfile.ZipFile(io.BytesIO(docx_bytes)) as docx:
+        media = [name for name in docx.namelist() if name.startswith("word/media/")]
+        assert len(media) == 1
+        with Image.open(io.BytesIO(docx.read(media[0]))) as img:
+            assert img.format == "PNG"
+            assert img.mode == "P"
+            assert [round(d) for d in img.info["dpi"]] == [reporting._DOCX_PLOT_DPI] * 2
+            assert img.width <= 8 * reporting._DOCX_PLOT_DPI
+
+
+def test_docx_plot_keeps_rgb_png_when_palette_conversion_fails(monkeypatch, default_rc):
+    job = _plot_jobs()[2]
+    rgb = reporting._render_plot_png_bytes(job, dpi=reporting._DOCX_PLOT_DPI)
+
+    def broken_open(*args, **kwargs):
+        raise OSError("cannot identify image file")
+
+    monkeypatch.setattr(Image, "open", broken_open)
+    assert reporting._render_docx_plot_png(job) == rgb
+
+
+def test_reused_figure_renders_like_a_fresh_process(default_rc):
+    km = _plot_jobs()[1]
+    script = (
+        "import json, sys\n"
+        "from app.modules import reporting\n"
+        "sys.stdout.buffer.write(reporting._render_plot_png_bytes(json.loads(sys.argv[1])))\n"
+    )
+    fresh = subprocess.run(
+        [sys.executable, "-c", script, json.dumps(km)],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True, check=True,
+    ).stdout
+
+    # Leave this thread's figure as far from fresh as a previous plot could
+    with reporting._reusable_figure((4, 3)) as fig:
+        fig.add_subplot().plot([0, 1], [1, 0])
+        fig.set_dpi(50)
+        fig.set_facecolor("black")
+        fig.set_edgecolor("red")
+        fig.set_frameon(False)
+        fig.subplots_adjust(left=0.3, top=0.6)
+        fig.set_layout_engine("constrained")
+    assert fig.axes == []
+    assert fig is reporting._PLOT_FIGURES.figure
+
+    # tight_layout and savefig mask some of these in the PNG, so compare directly
+    new = Figure(figsize=(8, 5))
+    with reporting._reusable_figure((8, 5)) as fig:
+        assert fig.get_size_inches().tolist() == new.get_size_inches().tolist()
+        assert fig.dpi == new.dpi
+        assert fig.get_facecolor() == new.get_facecolor()
+        assert fig.get_edgecolor() == new.get_edgecolor()
+        assert fig.get_frameon() == new.get_frameon()
+        assert fig.get_layout_engine() is new.get_layout_engine() is None
+        for name in reporting._SUBPLOT_PARAMS:
+            assert getattr(fig.subplotpars, name) == getattr(new.subplotpars, name)
+    assert reporting._render_plot_png_bytes(km) == fresh
+
+    # ...and after a different plot rendered at another dpi
+    box = {"plot_data": [{"group": g, "value": float(v)} for g, v in zip("AB" * 6, range(12))]}
+    assert reporting._render_docx_plot_png(box)
+    assert reporting._render_plot_png_bytes(km) == fresh
+    assert reporting._PLOT_FIGURES.figure.axes == []
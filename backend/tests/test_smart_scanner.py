@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+
+from app.modules.smart_scanner import SmartScanner
+
+
+def _make_df():
+    np.random.seed(42)
+    n = 200
+    return pd.DataFrame({
+        "patient_id": np.arange(n),
+        "group": np.random.choice(["A", "B"], n),
+        "age": np.random.normal(50, 10, n),
+        "constant": np.ones(n),
+        "dirty": [str(x) for x in range(n - 4)] + ["n/a", "n/a", "-", "?"],
+    })
+
+
+def test_scan_dataset_structure():
+    df = _make_df()
+    result = SmartScanner().scan_dataset(df)
+
+    assert result["profile"]["row_count"] == len(df)
+    assert result["profile"]["col_count"] == len(df.columns)
+    assert len(result["profile"]["head"]) == 10
+    assert set(result["scan_report"]["columns"]) == set(df.columns)
+
+
+def test_constant_column_skips_normality():
+    df = _make_df()
+    report = SmartScanner().scan_dataset(df)["scan_report"]
+
+    assert report["columns"]["constant"]["normality"] == {"is_normal": False, "p_value": 1.0}
+    assert report["columns"]["age"]["normality"]["p_value"] is not None
+
+
+def test_empty_numeric_column_has_no_normality_p():
+    df = _make_df()
+    df["empty"] = np.nan
+    df["constant_with_gaps"] = np.where(np.arange(len(df)) % 2, 3.0, np.nan)
+    cols = SmartScanner().scan_dataset(df)["scan_report"]["columns"]
+
+    assert cols["empty"]["normality"] == {"is_normal": False, "p_value": None}
+    assert cols["constant_with_gaps"]["normality"] == {"is_normal": False, "p_value": 1.0}
+
+
+def test_mixed_type_polluters():
+    df = _make_df()
+    report = SmartScanner().scan_dataset(df)["scan_report"]
+    dirty = report["columns"]["dirty"]
+
+    assert dirty["mixed_type_suspected"] is True
+    assert sorted(dirty["polluting_values"]) == ["-", "?", "n/a"]
+    assert any(i["column"] == "dirty" and i["type"] == "mixed_type" for i in report["issues"])
+
+
+def test_missing_report_sorted_by_count():
+    df = _make_df()
+    df.loc[:9, "age"] = np.nan
+    df.loc[:19, "group"] = None
+    report = SmartScanner().scan_dataset(df)["scan_report"]
+    missing = report["missing_report"]
+
+    assert missing["columns_with_missing"] == 2
+    assert [m["column"] for m in missing["by_column"]] == ["group", "age"]
+    assert missing["by_column"][0]["missing_count"] == 20
+    assert missing["by_column"][0]["missing_percent"] == 10.0
+    assert report["columns"]["age"]["missing_count"] == 10
+
+
+def test_optimize_dtypes():
+    df = pd.DataFrame({
+        "small_int": np.arange(100, dtype="int64"),
+        "value": np.linspace(0, 1, 100),
+        "numeric_text": [str(i) for i in range(100)],
+        "group": ["A", "B"] * 50,
+        "free_text": [f"note {i}" for i in range(100)],
+    })
+    out = SmartScanner().optimize_dtypes(df)
+
+    assert out["small_int"].dtype == np.int8
+    assert out["value"].dtype == np.float32
+    assert pd.api.types.is_integer_dtype(out["numeric_text"].dtype)
+    assert out["numeric_text"].tolist() == list(range(100))
+    assert isinstance(out["group"].dtype, pd.CategoricalDtype)
+    assert out["free_text"].dtype == object
+    assert list(out.columns) == list(df.columns)
+
+
+def test_optimize_dtypes_object_bools_stay_categorical():
+    flags = pd.Series([True, False, None] * 20, dtype=object)
+    out = SmartScanner().optimize_dtypes(pd.DataFrame({"flag": flags}))
+
+    assert isinstance(out["flag"].dtype, pd.CategoricalDtype)
+    assert out["flag"].isna().sum() == 20
+    assert out["flag"].tolist()[:2] == [True, False]
+
+
+def test_numeric_summary_matches_numpy():
+    df = _make_df()
+    df.loc[0, "age"] = np.inf
+    col = SmartScanner().scan_dataset(df)["scan_report"]["columns"]["age"]
+    finite = df["age"].to_numpy()[1:]
+    counts, edges = np.histogram(finite, bins=12)
+
+    assert col["histogram"]["bins"] == counts.tolist()
+    assert np.allclose(col["histogram"]["edges"], edges)
+    assert np.isclose(col["mean"], finite.mean())
+    assert col["min"] == finite.min() and col["max"] == finite.max()
+
+
+def test_head_is_json_safe():
+    df = _make_df()
+    df.loc[0, "age"] = np.inf
+    df.loc[1, "age"] = np.nan
+    df.loc[2, "group"] = None
+    head = SmartScanner().scan_dataset(df)["profile"]["head"]
+
+    assert head[0]["age"] is None
+    assert head[1]["age"] is None
+    assert head[2]["group"] is None
+    assert isinstance(head[3]["age"], float)
+
+
+def test_large_column_uses_normaltest():
+    np.random.seed(0)
+    df = pd.DataFrame({"x": np.random.normal(size=6000), "y": np.random.exponential(size=6000)})
+    cols = SmartScanner().scan_dataset(df)["scan_report"]["columns"]
+
+    assert cols["x"]["normality"]["is_normal"] is True
+    assert cols["y"]["normality"]["is_normal"] is False
+
+
+def test_wide_frame_parallel_scan_keeps_column_order():
+    np.random.seed(1)
+    df = pd.DataFrame({f"v{i}": np.random.normal(size=50) for i in range(40)})
+    df["label"] = ["a", "b"] * 25
+    result = SmartScanner().scan_dataset(df)
+
+    assert list(result["scan_report"]["columns"]) == list(df.columns)
+    assert [c["name"] for c in result["profile"]["columns"]] == list(df.columns)
+    assert np.isclose(result["scan_report"]["columns"]["v7"]["mean"], df["v7"].mean())
+
+
+def test_reorder_suggestion_groups_by_role():
+    df = pd.DataFrame({
+        "notes": [f"note {i % 30}" for i in range(60)],
+        "score": np.tile([1.5, 2.5, 3.5], 20),
+        "group": ["A", "B"] * 30,
+        "subject_code": [f"S{i}" for i in range(60)],
+    })
+    order = SmartScanner().scan_dataset(df)["scan_report"]["reorder_suggestion"]
+
+    assert order == ["subject_code", "group", "score", "notes"]
+
+
+def test_integer_id_column_skips_normality():
+    df = _make_df()
+    col = SmartScanner().scan_dataset(df)["scan_report"]["columns"]["patient_id"]
+
+    assert col["id_column"] is True
+    assert col["normality"]["p_value"] is None
+    assert "histogram" not in col
+    assert col["min"] == 0 and col["max"] == len(df) - 1
@@ -0,0 +1,249 @@
+import numpy as np
+import pytest
+
+from app.modules import stat_knowledge
+from app.modules.stat_knowledge import (
+    STAT_TERMS,
+    TEST_KNOWLEDGE,
+    CORRECTION_METHODS,
+    AltReason,
+    alternative_for,
+    classify_many,
+    classify_effect_size,
+    get_all_terms,
+    get_definition,
+    get_effect_size_interpretation,
+    get_explanation,
+    get_power_recommendation,
+    get_references_for_test,
+    get_rationale,
+    get_reporting_template,
+    get_reporting_templates,
+    select_test,
+    tests_reporting,
+    tests_requiring,
+    tests_suggesting,
+    term_name,
+    get_test_rationale,
+    practical_meaning_d,
+    render_term,
+)
+
+
+def test_definition_lookup_matches_nested_data():
+    full = stat_knowledge.STAT_TERMS_FULL
+    for level in ("junior", "mid", "senior"):
+        assert get_definition("p_value", level) == full["p_value"]["definition"][level]
+    assert "definition" not in STAT_TERMS["p_value"]
+    assert full["p_value"]["emoji"] == STAT_TERMS["p_value"]["emoji"]
+    assert full["p_value"]["term_ru"] == term_name("p_value", "ru")
+    assert get_definition("__missing__", "junior") is None
+    assert get_explanation("power", "senior")["definition"] == get_definition("power", "senior")
+    assert get_explanation("p_value")["common_mistakes"] == full["p_value"]["common_mistakes"]
+
+
+def test_rationale_lookup_matches_nested_data():
+    assert get_rationale("anova", "mid") == TEST_KNOWLEDGE["anova"]["why_it_works"]["mid"]
+    assert get_test_rationale("anova", level="mid")["why_it_works"] == get_rationale("anova", "mid")
+
+
+def test_effect_size_bands_are_upper_inclusive():
+    assert classify_effect_size("cohens_d", 0.2) == "незначительный"
+    assert classify_effect_size("cohens_d", -0.6) == "средний"
+    assert classify_effect_size("cohens_d", 0.8) == "средний"
+    assert classify_effect_size("cohens_d", 3.0) == "большой"
+    assert classify_effect_size("r", float("nan")) == "unknown"
+    assert get_effect_size_interpretation("eta_squared", 0.14)["label"] == "средний"
+
+
+def test_power_bands_are_upper_exclusive():
+    assert [get_power_recommendation(p)["status"] for p in (0.49, 0.5, 0.8, 0.95)] == [
+        "critical", "insufficient", "adequate", "high",
+    ]
+
+
+def test_select_test_decision_table():
+    assert select_test(2, is_normal=True, equal_var=False) == "welch_t_test"
+    assert select_test(5, is_normal=False, equal_var=False) == "kruskal_wallis"
+    assert select_test(0, is_normal=True) == "pearson"
+    assert select_test(2, is_normal=False, dv="categorical") == "chi_square"
+    assert select_test(2, is_normal=True, paired=True) is None
+    assert all(key in TEST_KNOWLEDGE for key in stat_knowledge._TEST_LOOKUP.values())
+
+
+def test_practical_meaning_uses_nearest_anchor():
+    pairs = dict(STAT_TERMS["cohens_d"]["practical_meaning"])
+    for d in (0.0, 0.34, 0.35, 0.36, -0.6, 0.8, 2.5):
+        nearest = min(pairs, key=lambda x: abs(x - abs(d)))
+        assert practical_meaning_d(d) == pairs[nearest]
+    assert practical_meaning_d(float("nan")) == ""
+    assert get_effect_size_interpretation("cohens_d", 0.45)["practical_meaning"] == pairs[0.5]
+
+
+def test_render_term():
+    text = render_term("p_value", "mid")
+    assert text == f"📊 P-значение\n{get_definition('p_value', 'mid')}"
+    assert render_term("p_value", "mid", locale="en").startswith("📊 P-value\n")
+    assert render_term("__missing__") == "__missing__"
+
+
+def test_band_labels_are_shared_objects():
+    thresholds = STAT_TERMS["effect_size"]["thresholds"]
+    assert thresholds["cohens_d"][1].label is thresholds["eta_squared"][0].label
+    assert thresholds["eta_squared"] is thresholds["partial_eta_squared"]
+    assert classify_effect_size("r", 0.9) is thresholds["r"][-1].label
+
+
+def test_meta_records_support_attribute_and_mapping_access():
+    anova = TEST_KNOWLEDGE["anova"]
+    assert anova.post_hoc == anova["post_hoc"] == ("tukey", "bonferroni", "holm")
+    assert "formula" not in STAT_TERMS["p_value"]
+    assert STAT_TERMS["p_value"].get("formula", "-") == "-"
+    with pytest.raises(AttributeError):
+        anova.name = "other"
+
+
+def test_inverted_indexes_match_scan():
+    for assumption in ("normality", "independence", "__missing__"):
+        expected = tuple(t for t, m in TEST_KNOWLEDGE.items() if assumption in m["assumptions"])
+        assert tests_requiring(assumption) == expected
+    assert "anova" in tests_reporting("eta_squared")
+    assert "anova" in tests_suggesting("kruskal_wallis")
+
+
+def test_alternative_for_matches_alternatives_dicts():
+    for test_id, meta in TEST_KNOWLEDGE.items():
+        for reason in AltReason:
+            alt = (meta.alternatives or {}).get(reason.name.lower())
+            assert alternative_for(test_id, reason) == (alt["test"] if alt else None)
+    assert alternative_for("anova", AltReason.NON_NORMAL) == "kruskal_wallis"
+    assert alternative_for("__missing__", AltReason.OUTLIERS) is None
+
+
+def test_duplicate_strings_share_one_object():
+    tests = TEST_KNOWLEDGE
+    assert tests["t_test_ind"].emoji is tests["welch_t_test"].emoji
+    reason = tests["t_test_ind"].alternatives["non_normal"]["reason"]
+    assert reason is tests["anova"].alternatives["non_normal"]["reason"]
+
+
+def test_classify_many_matches_scalar_classifier():
+    values = [0.0, 0.2, -0.35, 0.5, 0.8, 0.81, float("nan"), 12.0]
+    for metric in ("cohens_d", "r", "eta_squared"):
+        assert classify_many(metric, values).tolist() == [classify_effect_size(metric, v) for v in values]
+    assert classify_many("__missing__", values).tolist() == ["unknown"] * len(values)
+
+
+def test_term_name_per_locale():
+    assert term_name("p_value", "en") == "P-value"
+    assert term_name("p_value", "ru") == "P-значение"
+    assert term_name("p_value") == term_name("p_value", stat_knowledge.LOCALE)
+    assert term_name("__missing__") == "__missing__"
+    assert "term" not in STAT_TERMS["p_value"]
+
+
+def test_thresholds_are_contiguous_bands():
+    bands = STAT_TERMS["effect_size"]["thresholds"]["cohens_d"]
+    assert [b.hi for b in bands] == [0.2, 0.5, 0.8, float("inf")]
+    assert all(prev.hi == nxt.lo for prev, nxt in zip(bands, bands[1:]))
+    assert bands[0].lo == 0.0 and bands[-1].label == "большой"
+
+
+def test_correction_methods_are_ordered_records():
+    assert [m.key for m in CORRECTION_METHODS] == ["bonferroni", "holm", "bh", "by"]
+    methods = STAT_TERMS["multiple_comparison"].methods
+    assert methods["bonferroni"] is CORRECTION_METHODS[0]
+    assert methods["bonferroni"].formula == "α_adj = α / n"
+    assert methods["bh"].formula == ""
+
+
+def test_effect_size_interpretation_payload():
+    out = get_effect_size_interpretation("cohens_d", -0.55)
+    assert out["type"] == "cohens_d" and out["abs_value"] == 0.55
+    assert out["label"] == "средний" and out["direction"] == "negative"
+    assert get_effect_size_interpretation("eta_squared", 0.2)["type"] == "partial_eta_squared"
+    assert get_effect_size_interpretation("omega", 0.2) == {"label": "unknown", "interpretation": ""}
+
+
+def test_reporting_template_formats_only_used_fields():
+    result = {"t": 2.45, "df": 48, "p_value": 0.018, "effect_size": 0.71}
+    assert get_reporting_template("t_test_ind", result) == "t(48) = 2.45, p = 0.018, d = 0.71 [средний]"
+    assert get_reporting_template("anova", {"df_between": 2, "df_within": 40, "stat_value": 5.1,
+                                            "p_value": 0.0001, "effect_size": 0.2,
+                                            "effect_size_type": "eta_squared"}) == (
+        "F(2, 40) = 5.10, p < .001, η² = 0.200 [большой]"
+    )
+    # No effect placeholder: the effect size is never touched
+    assert get_reporting_template("kruskal_wallis", {"df": 2, "stat_value": 7.0, "effect_size": None}) == (
+        "H(2) = 7.00, p = 1.000"
+    )
+    assert get_reporting_template("welch_t_test", {"df": "x"}) == ""
+    assert get_reporting_template("unknown_test", result) == ""
+
+
+def test_all_terms_listing_is_not_shared_between_calls():
+    terms = get_all_terms()
+    assert [t["key"] for t in terms] == list(STAT_TERMS)
+    terms.clear()
+    assert len(get_all_terms()) == len(STAT_TERMS)
+
+
+def test_references_for_test():
+    refs = get_references_for_test("mann_whitney")
+    assert [r["key"] for r in refs] == ["mann_whitney", "effect_size_primer"]
+    assert refs[0]["citation"] == stat_knowledge.ACADEMIC_REFERENCES["mann_whitney"]["citation"]
+    assert [r["key"] for r in get_references_for_test("unknown")] == ["de_smith_handbook"]
+
+
+def test_assumption_checks_from_profile():
+    checks = get_test_rationale("t_test_ind", {"shapiro_p": 0.01, "levene_p": 0.3})["assumption_checks"]
+    by_key = {c["assumption"]: c for c in checks}
+    assert by_key["normality"]["passed"] is False
+    assert by_key["normality"]["note"] == "Shapiro-Wilk test"
+    assert by_key["normality"]["recommendation"] == STAT_TERMS["normality"].if_violated
+    assert by_key["homogeneity"] == {"assumption": "homogeneity", "term": term_name("homogeneity", "en"),
+                                     "passed": True, "p_value": 0.3, "note": "Levene's test"}
+    assert by_key["independence"]["passed"] is True
+
+
+def test_classify_many_kernels_agree():
+    values = np.random.default_rng(0).normal(scale=0.6, size=500)
+    values[::7] = np.nan
+    cuts, labels = stat_knowledge._CLASSIFIER_ARRAYS["cohens_d"]
+    expected = labels[stat_knowledge._band_indices_numpy(values, cuts, len(labels) - 1)]
+    assert classify_many("cohens_d", values).tolist() == expected.tolist()
+    assert classify_many("r", values.reshape(20, 25)).shape == (20, 25)
+
+
+def test_explanations_are_cached_read_only():
+    first = get_explanation("p_value", "mid")
+
+    assert get_explanation("p_value", "mid") is first
+    with pytest.raises(TypeError):
+        first["definition"] = "changed"
+    rationale = get_test_rationale("t_test_ind", {"shapiro_p": 0.01})
+    assert "assumption_checks" in rationale
+    assert "assumption_checks" not in get_test_rationale("t_test_ind")
+
+
+def test_reporters_skip_effect_label_when_template_lacks_it(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("effect label computed for a template without {effect_label}")
+
+    monkeypatch.setattr(stat_knowledge, "get_effect_size_interpretation", fail)
+    for test_id in ("kruskal_wallis", "pearson", "spearman", "mann_whitney", "chi_square"):
+        assert get_reporting_template(test_id, {"df": 3, "stat_value": 4.0, "p_value": 0.2, "effect_size": 0.3})
+
+
+def test_batched_reporting_templates_keep_row_order():
+    rows = [
+        {"test_id": "pearson", "df": 30, "stat_value": 0.41, "p_value": 0.02},
+        {"test_id": "t_test_ind", "t": 2.45, "df": 48, "p_value": 0.018, "effect_size": 0.71},
+        {"test_id": "unknown_test"},
+        {"test_id": "pearson", "df": 10, "stat_value": -0.2, "p_value": 0.5},
+    ]
+
+    assert get_reporting_templates(rows) == [
+        get_reporting_template(row.get("test_id"), row) for row in rows
+    ]
+    assert get_reporting_templates([]) == []
@@ -0,0 +1,75 @@
+from app.modules.text_generator import TextGenerator
+
+
+VARIABLES = {"target": "score", "group": "arm"}
+
+
+def _group_result(significant=True, **extra):
+    result = {
+        "method": {"id": "t_test_ind", "name": "t-test"},
+        "p_value": 0.0004 if significant else 0.2,
+        "significant": significant,
+        "groups": ["A", "B"],
+        "plot_stats": {"A": {"mean": 3.2}, "B": {"mean": 2.1}},
+    }
+    result.update(extra)
+    return result
+
+
+def test_group_comparison_reports_direction_of_means():
+    text = TextGenerator.generate_conclusion(_group_result(effect_size=0.45), VARIABLES)
+    assert "(p < 0.001, Cohen's d = 0.45 (small effect))" in text
+    assert "the score in the A group (M = 3.20) was significantly higher than in the B group (M = 2.10)" in text
+
+    simple = TextGenerator.generate_conclusion(_group_result(), VARIABLES, style="simple")
+    assert simple == "A significant difference was found. A showed higher values than B."
+
+
+def test_group_comparison_not_significant_and_missing_stats():
+    result = _group_result(significant=False, plot_stats={})
+    text = TextGenerator.generate_conclusion(result, VARIABLES, style="ru")
+    assert text.endswith("Статистически значимых различий не выявлено (p = 0.200).")
+
+    result = _group_result(plot_stats={"A": {}})
+    text = TextGenerator.generate_conclusion(result, VARIABLES)
+    assert "(M = 0.00)" in text
+
+
+def test_interpret_effect_size_bands_and_aliases():
+    interpret = TextGenerator.interpret_effect_size
+    assert interpret(0.2) == "small effect"
+    assert interpret(-0.79, "Cohen-d") == "medium effect"
+    assert interpret(0.06, "Eta Squared") == "medium effect"
+    assert interpret(0.05, "partial-eta2") == "small effect"
+    assert interpret(0.5, "Rank-Biserial correlation") == "large effect"
+    assert interpret(0.09, "cramers v") == "negligible effect"
+    assert interpret(None) == ""
+
+
+def test_correlation_conclusion_every_style():
+    result = {"method": "pearson", "p_value": 0.002, "significant": True, "stat_value": -0.42}
+    variables = {"target": "score", "predictor": "age"}
+    for style in ("pro", "ru", "simple"):
+        text = TextGenerator.generate_conclusion(result, variables, style=style)
+        assert "a statistically significant, moderate negative correlation between score and age (r = -0.42, p = 0.002)" in text
+        assert text.endswith("as age increases, score tends to decrease.")
+
+    weak = TextGenerator.generate_conclusion({**result, "method": "spearman", "stat_value": 0.15}, variables)
+    assert "weak positive correlation" in weak
+    ns = TextGenerator.generate_conclusion({**result, "significant": False, "p_value": 0.3}, variables)
+    assert "The relationship was not statistically significant (p = 0.300)." in ns
+
+
+def test_generate_conclusion_dispatch():
+    chi = {"method": "chi_square", "p_value": 0.01, "significant": True}
+    assert TextGenerator.generate_conclusion(chi, VARIABLES).startswith("A Chi-Square test of independence")
+    one = {"method": {"id": "t_test_one"}, "p_value": 0.5, "significant": False,
+           "extra": {"test_value": 1}, "plot_stats": {"group": {"mean": 1.1}}}
+    assert "(M = 1.10, p = 0.500)" in TextGenerator.generate_conclusion(one, VARIABLES, style="ru")
+    assert TextGenerator.generate_conclusion({"method": "kaplan_meier"}, VARIABLES) == "Analysis completed."
+
+
+def test_format_p_value():
+    assert TextGenerator.format_p_value(0.0004) == "p < 0.001"
+    assert TextGenerator.format_p_value(0.001) == "p = 0.001"
+    assert TextGenerator.format_p_value(0.04567) == "p = 0.046"